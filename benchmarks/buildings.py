@@ -0,0 +1,108 @@
+import argparse
+import asyncio
+import os
+import pathlib
+import random
+import statistics
+import tempfile
+import time
+
+from elkollege_schedule_bot import constants
+from elkollege_schedule_bot.managers import database
+from elkollege_schedule_bot.services import parser
+
+BUILDINGS_COUNT = 10
+LOOKUPS_COUNT = 5000
+UPLOADER_ID = 0
+
+
+def _get_percentile(values: list[float], percentile: int) -> float:
+    return statistics.quantiles(values, n=100)[percentile - 1] * 1000
+
+
+async def _lookup(database_manager: database.DatabaseManager, building_ids: list[int]) -> list[float]:
+    latencies = []
+
+    for _ in range(LOOKUPS_COUNT):
+        building_id = random.choice(building_ids)
+
+        started = time.perf_counter()
+
+        await database_manager.schedules.get_schedule(
+            building_id=building_id,
+        )
+        await database_manager.schedules.get_day_schedule(
+            building_id=building_id,
+            group_name=random.choice(database_manager.schedules.get_group_names(building_id)),
+            weekday=random.randrange(6),
+        )
+
+        latencies.append(time.perf_counter() - started)
+
+    return latencies
+
+
+async def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("path", type=pathlib.Path)
+    arguments = argument_parser.parse_args()
+
+    data = parser._parse_schedule(arguments.path.read_bytes(), True)
+    building_ids = list(range(constants.DEFAULT_BUILDING_ID, constants.DEFAULT_BUILDING_ID + BUILDINGS_COUNT))
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+
+        database_manager = database.DatabaseManager()
+
+        started = time.perf_counter()
+
+        for building_id in building_ids:
+            await database_manager.schedules.add_schedule(
+                building_id=building_id,
+                data=data,
+                uploader_id=UPLOADER_ID,
+            )
+
+        upload_time = (time.perf_counter() - started) / BUILDINGS_COUNT
+
+        latencies = await _lookup(database_manager, building_ids)
+
+        versions = {
+            building_id: database_manager.schedules.get_version(building_id) for building_id in building_ids
+        }
+        misses = database_manager.schedules.cache_info.misses
+
+        started = time.perf_counter()
+
+        await database_manager.schedules.edit_data(
+            building_id=building_ids[0],
+            data=data,
+            uploader_id=UPLOADER_ID,
+        )
+
+        reupload_time = time.perf_counter() - started
+
+        for building_id in building_ids[1:]:
+            await database_manager.schedules.get_schedule(
+                building_id=building_id,
+            )
+
+        print(f"{arguments.path.name}: {BUILDINGS_COUNT} buildings")
+        print(
+            f"upload {upload_time * 1000:8.2f} ms/building | "
+            f"reupload one {reupload_time * 1000:8.2f} ms"
+        )
+        print(
+            f"lookup p50 {_get_percentile(latencies, 50):8.3f} ms | "
+            f"lookup p99 {_get_percentile(latencies, 99):8.3f} ms"
+        )
+        print(
+            f"invalidated after reupload: "
+            f"versions {sum(database_manager.schedules.get_version(building_id) != version for building_id, version in versions.items())} | "
+            f"cache misses {database_manager.schedules.cache_info.misses - misses}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import tempfile
+import time
+
+from elkollege_schedule_bot.managers import database
+
+BUILDINGS_COUNT = 10
+LOOKUPS_COUNT = 1000
+TABLE_SIZES = (1000, 10000, 100000, 500000)
+
+
+def _create_connection(path: str, with_migrations: bool) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.execute(database.SubstitutionsDatabase._SQL)
+
+    if with_migrations:
+        for statement in database.Database._PRAGMAS + database.SubstitutionsDatabase._MIGRATIONS:
+            connection.execute(statement)
+
+    connection.commit()
+
+    return connection
+
+
+def _fill(connection: sqlite3.Connection, table_size: int) -> None:
+    connection.executemany(
+        f"INSERT INTO {database.SubstitutionsDatabase._NAME} (building_id, timestamp) VALUES (?, ?)",
+        (
+            (
+                row_index % BUILDINGS_COUNT + 1,
+                row_index // BUILDINGS_COUNT * 86400,
+            ) for row_index in range(table_size)
+        ),
+    )
+    connection.commit()
+
+
+def _measure(connection: sqlite3.Connection, table_size: int) -> float:
+    started = time.perf_counter()
+
+    for lookup_index in range(LOOKUPS_COUNT):
+        row_index = lookup_index * table_size // LOOKUPS_COUNT
+
+        connection.execute(
+            f"SELECT * FROM {database.SubstitutionsDatabase._NAME} WHERE building_id = ? AND timestamp = ?",
+            (
+                row_index % BUILDINGS_COUNT + 1,
+                row_index // BUILDINGS_COUNT * 86400,
+            ),
+        ).fetchone()
+
+    return (time.perf_counter() - started) / LOOKUPS_COUNT
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for table_size in TABLE_SIZES:
+            lookup_times = []
+
+            for with_migrations in (False, True):
+                path = os.path.join(directory, f"{table_size}_{with_migrations}.db")
+                connection = _create_connection(path, with_migrations)
+
+                _fill(connection, table_size)
+                lookup_times.append(_measure(connection, table_size))
+
+                connection.close()
+
+            print(
+                f"{table_size:>7} rows | "
+                f"without indexes {lookup_times[0] * 1e6:10.1f} us | "
+                f"with indexes {lookup_times[1] * 1e6:8.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import pyquoks.utils
+
+from elkollege_schedule_bot import models
+from elkollege_schedule_bot.managers import database
+
+BULK_WRITES_COUNT = 20000
+CALLBACKS_COUNT = 2000
+CALLBACKS_INTERVAL = 0.001
+HEARTBEAT_INTERVAL = 0.001
+
+
+def _get_percentile(values: list[float], percentile: int) -> float:
+    return statistics.quantiles(values, n=100)[percentile - 1] * 1000
+
+
+def _insert_users(users_database: database.UsersDatabase) -> None:
+    default_values = models.DatabaseUser._default_values()
+
+    users_database.cursor().executemany(
+        pyquoks.utils.format_multiline_string(
+            f"""
+                INSERT OR IGNORE INTO {users_database._NAME} (
+                id,
+                building_id,
+                group_name,
+                is_notifiable
+                )
+                VALUES (?, ?, ?, ?)
+            """,
+        ),
+        (
+            (
+                _id,
+                default_values["building_id"],
+                default_values["group_name"],
+                default_values["is_notifiable"],
+            ) for _id in range(BULK_WRITES_COUNT)
+        ),
+    )
+
+    users_database.commit()
+
+
+async def _bulk_write(database_manager: database.DatabaseManager) -> None:
+    await asyncio.get_running_loop().run_in_executor(
+        database._executor,
+        _insert_users,
+        database_manager.users,
+    )
+
+
+async def _callback(database_manager: database.DatabaseManager, _id: int) -> float:
+    started = time.perf_counter()
+
+    await database_manager.users.add_user(
+        _id=_id,
+        **models.DatabaseUser._default_values(),
+    )
+    await database_manager.users._fetch_user(
+        _id=_id,
+    )
+
+    return time.perf_counter() - started
+
+
+async def _heartbeat(stop_event: asyncio.Event) -> list[float]:
+    lags = []
+
+    while not stop_event.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(time.perf_counter() - started - HEARTBEAT_INTERVAL)
+
+    return lags
+
+
+async def _measure(database_manager: database.DatabaseManager, with_bulk_write: bool) -> None:
+    stop_event = asyncio.Event()
+    heartbeat_task = asyncio.create_task(_heartbeat(stop_event))
+    bulk_write_task = asyncio.create_task(_bulk_write(database_manager)) if with_bulk_write else None
+
+    latencies = []
+
+    for _id in range(CALLBACKS_COUNT):
+        latencies.append(await _callback(database_manager, -_id - 1))
+        await asyncio.sleep(CALLBACKS_INTERVAL)
+
+    stop_event.set()
+    lags = await heartbeat_task
+
+    if bulk_write_task:
+        await bulk_write_task
+
+    print(
+        f"{"bulk write" if with_bulk_write else "idle":>10} | "
+        f"callback p50 {_get_percentile(latencies, 50):8.3f} ms | "
+        f"callback p99 {_get_percentile(latencies, 99):8.3f} ms | "
+        f"loop lag p99 {_get_percentile(lags, 99):8.3f} ms | "
+        f"loop lag max {max(lags) * 1000:8.3f} ms"
+    )
+
+
+async def main() -> None:
+    for with_bulk_write in (False, True):
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+
+            await _measure(database.DatabaseManager(), with_bulk_write=with_bulk_write)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
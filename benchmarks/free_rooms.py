@@ -0,0 +1,140 @@
+import argparse
+import asyncio
+import os
+import pathlib
+import random
+import statistics
+import tempfile
+import time
+
+import schedule_parser.models
+import schedule_parser.utils
+
+from elkollege_schedule_bot import constants
+from elkollege_schedule_bot import models
+from elkollege_schedule_bot.managers import database
+from elkollege_schedule_bot.services import parser
+
+LOOKUPS_COUNT = 5000
+SUBSTITUTIONS_SHARE = 0.1
+UPLOADER_ID = 0
+
+
+def _get_percentile(values: list[float], percentile: int) -> float:
+    return statistics.quantiles(values, n=100)[percentile - 1] * 1000000
+
+
+def _get_free_rooms_by_walk(
+        groups_list: list[schedule_parser.models.GroupSchedule],
+        rooms: set[str],
+        substitutions_index: models.SubstitutionsIndex,
+        weekday: int,
+        number: int,
+) -> set[str]:
+    occupied_rooms = set()
+
+    for group_schedule in groups_list:
+        day_schedule = next(
+            (day_schedule for day_schedule in group_schedule.days_list if day_schedule.weekday == weekday),
+            None,
+        )
+
+        for period in schedule_parser.utils.apply_substitutions_to_schedule(
+                schedule=day_schedule.periods_list if day_schedule else [],
+                substitutions=substitutions_index.groups_dict.get(group_schedule.group_name, []),
+        ):
+            if period.number == number:
+                occupied_rooms.add(period.room)
+
+    return rooms - occupied_rooms
+
+
+def _measure(function, slots: list[tuple[int, int]]) -> list[float]:
+    latencies = []
+
+    for _ in range(LOOKUPS_COUNT):
+        weekday, number = random.choice(slots)
+
+        started = time.perf_counter()
+
+        function(weekday, number)
+
+        latencies.append(time.perf_counter() - started)
+
+    return latencies
+
+
+async def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("path", type=pathlib.Path)
+    arguments = argument_parser.parse_args()
+
+    data = parser._parse_schedule(arguments.path.read_bytes(), True)
+    groups_list = models.DatabaseSchedule.unpack_groups_list(data)
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+
+        database_manager = database.DatabaseManager()
+
+        await database_manager.schedules.add_schedule(
+            building_id=constants.DEFAULT_BUILDING_ID,
+            data=data,
+            uploader_id=UPLOADER_ID,
+        )
+
+        rooms = set(database_manager.schedules._rooms[constants.DEFAULT_BUILDING_ID])
+        slots = list(database_manager.schedules._slots[constants.DEFAULT_BUILDING_ID])
+
+        substitutions_index = database_manager.substitutions._get_index(
+            [
+                schedule_parser.models.Substitution(
+                    group_name=group_name,
+                    number=number,
+                    subject="",
+                    teacher="",
+                    room=random.choice(sorted(rooms)),
+                ) for (weekday, number), groups_dict in database_manager.schedules._slots[
+                    constants.DEFAULT_BUILDING_ID
+                ].items() for group_name in groups_dict if random.random() < SUBSTITUTIONS_SHARE
+            ],
+        )
+
+        print(f"{arguments.path.name}: {len(groups_list)} groups, {len(rooms)} rooms, {len(slots)} slots")
+
+        for name, latencies in (
+                (
+                        "walk",
+                        _measure(
+                            lambda weekday, number: _get_free_rooms_by_walk(
+                                groups_list=groups_list,
+                                rooms=rooms,
+                                substitutions_index=substitutions_index,
+                                weekday=weekday,
+                                number=number,
+                            ),
+                            slots,
+                        ),
+                ),
+                (
+                        "bitmap",
+                        _measure(
+                            lambda weekday, number: database_manager.schedules.get_free_rooms(
+                                building_id=constants.DEFAULT_BUILDING_ID,
+                                weekday=weekday,
+                                number=number,
+                                substitutions_index=substitutions_index,
+                            ),
+                            slots,
+                        ),
+                ),
+        ):
+            print(
+                f"{name:>6} | "
+                f"lookup p50 {_get_percentile(latencies, 50):10.1f} us | "
+                f"lookup p99 {_get_percentile(latencies, 99):10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+import argparse
+import json
+import pathlib
+import time
+import typing
+
+import schedule_parser.models
+
+from elkollege_schedule_bot import models
+from elkollege_schedule_bot import serializers
+from elkollege_schedule_bot.services import parser
+
+REPEATS_COUNT = 100
+
+
+def _measure(function: typing.Callable[[], typing.Any]) -> float:
+    started = time.perf_counter()
+
+    for _ in range(REPEATS_COUNT):
+        function()
+
+    return (time.perf_counter() - started) / REPEATS_COUNT
+
+
+def _decode_json_string(json_string: str) -> list[schedule_parser.models.GroupSchedule]:
+    return [
+        schedule_parser.models.GroupSchedule.model_validate(
+            group_schedule,
+        ) for group_schedule in json.loads(json_string)
+    ]
+
+
+def _decode_data(data: bytes) -> list[schedule_parser.models.GroupSchedule]:
+    return models.DatabaseSchedule.unpack_groups_list(data)
+
+
+def _decode_json_string_group(json_string: str, group_name: str) -> schedule_parser.models.GroupSchedule:
+    return schedule_parser.models.GroupSchedule.get_group_schedule_by_group_name(
+        iterable=_decode_json_string(json_string),
+        group_name=group_name,
+    )
+
+
+def _decode_data_group(data: bytes, group_name: str) -> schedule_parser.models.GroupSchedule:
+    return schedule_parser.models.GroupSchedule.model_validate(
+        serializers.PackedSegments(data).get(group_name),
+    )
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("path", type=pathlib.Path)
+    arguments = argument_parser.parse_args()
+
+    data = parser._parse_schedule(arguments.path.read_bytes(), True)
+    group_names_list = serializers.PackedSegments(data).names_list
+    json_string = json.dumps(
+        [group_schedule.model_dump() for group_schedule in _decode_data(data)]
+    )
+    group_name = group_names_list[len(group_names_list) // 2]
+
+    print(f"{arguments.path.name}: {len(group_names_list)} groups")
+
+    for name, size, decode_time, decode_group_time in (
+            (
+                    "json",
+                    len(json_string.encode()),
+                    _measure(lambda: _decode_json_string(json_string)),
+                    _measure(lambda: _decode_json_string_group(json_string, group_name)),
+            ),
+            (
+                    "packed",
+                    len(data),
+                    _measure(lambda: _decode_data(data)),
+                    _measure(lambda: _decode_data_group(data, group_name)),
+            ),
+    ):
+        print(
+            f"{name:>6} | "
+            f"size {size / 1024:8.1f} KiB | "
+            f"decode all {decode_time * 1000:8.3f} ms | "
+            f"decode one group {decode_group_time * 1000:8.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
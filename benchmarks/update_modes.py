@@ -0,0 +1,303 @@
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import os
+import pathlib
+import shutil
+import socket
+import tempfile
+import time
+import typing
+
+import aiogram
+import aiogram.client.session.base
+import aiogram.methods
+import aiohttp
+
+from elkollege_schedule_bot import constants
+from elkollege_schedule_bot import dispatcher
+from elkollege_schedule_bot import models
+from elkollege_schedule_bot.managers import config
+from elkollege_schedule_bot.managers import database
+from elkollege_schedule_bot.providers import buttons
+from elkollege_schedule_bot.providers import environment
+from elkollege_schedule_bot.providers import keyboards
+from elkollege_schedule_bot.providers import strings
+from elkollege_schedule_bot.services import broadcast
+from elkollege_schedule_bot.services import logger
+from elkollege_schedule_bot.services import metrics
+from elkollege_schedule_bot.services import parser
+
+BOT_TOKEN = "123456:benchmark"
+CONFIG_PATH = pathlib.Path(__file__).parents[1] / "src" / "config.ini"
+GET_UPDATES_LIMIT = 100
+RETRY_INTERVAL = 0.01
+WEBHOOK_CONNECTIONS = 40
+WEBHOOK_SECRET = "benchmark"
+
+
+class _BenchmarkSession(aiogram.client.session.base.BaseSession):
+    def __init__(self, updates_list: list[dict], latency: float) -> None:
+        super().__init__()
+
+        self._updates = collections.deque(updates_list)
+        self._latency = latency
+
+        self.webhook_set = asyncio.Event()
+
+    async def make_request(
+            self,
+            bot: aiogram.Bot,
+            method: aiogram.methods.TelegramMethod,
+            timeout: int | None = None,
+    ) -> typing.Any:
+        await asyncio.sleep(self._latency)
+
+        match method:
+            case aiogram.methods.GetMe():
+                return aiogram.types.User(
+                    id=int(BOT_TOKEN.split(":")[0]),
+                    is_bot=True,
+                    first_name="Benchmark",
+                    username="benchmark_bot",
+                )
+            case aiogram.methods.GetUpdates():
+                return [
+                    aiogram.types.Update.model_validate(
+                        self._updates.popleft(),
+                        context={
+                            "bot": bot,
+                        },
+                    ) for _ in range(min(GET_UPDATES_LIMIT, len(self._updates)))
+                ]
+            case aiogram.methods.SetWebhook():
+                self.webhook_set.set()
+
+        return True
+
+    async def stream_content(self, *args, **kwargs) -> typing.AsyncGenerator[bytes, None]:
+        yield b""
+
+    async def close(self) -> None:
+        pass
+
+
+def _get_synthetic_updates_list(count: int) -> list[dict]:
+    return [
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 0,
+                "chat": {
+                    "id": update_id + 1,
+                    "type": "private",
+                },
+                "from": {
+                    "id": update_id + 1,
+                    "is_bot": False,
+                    "first_name": "Benchmark",
+                },
+                "text": "/start",
+                "entities": [
+                    {
+                        "type": "bot_command",
+                        "offset": 0,
+                        "length": len("/start"),
+                    },
+                ],
+            },
+        } for update_id in range(count)
+    ]
+
+
+def _get_free_port() -> int:
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+
+        return free_socket.getsockname()[1]
+
+
+def _create_dispatcher(
+        updates_list: list[dict],
+        latency: float,
+        run_mode: models.RunMode,
+) -> tuple[dispatcher.AiogramDispatcher, _BenchmarkSession]:
+    config_manager = config.ConfigManager()
+    config_manager.settings.file_logging = False
+    config_manager.settings.metrics = False
+    config_manager.settings.run_mode = run_mode
+    config_manager.settings.webhook_host = "127.0.0.1"
+    config_manager.settings.webhook_port = _get_free_port()
+    config_manager.settings.webhook_url = f"http://127.0.0.1:{config_manager.settings.webhook_port}"
+
+    strings_provider = strings.StringsProvider()
+    keyboards_provider = keyboards.KeyboardsProvider(
+        buttons_provider=buttons.ButtonsProvider(
+            strings_provider=strings_provider,
+        ),
+    )
+    database_manager = database.DatabaseManager()
+    logger_service = logger.LoggerService(
+        filename=dispatcher.__name__,
+        file_handling=False,
+        level=logging.WARNING,
+    )
+    benchmark_session = _BenchmarkSession(
+        updates_list=updates_list,
+        latency=latency,
+    )
+    aiogram_bot = aiogram.Bot(
+        token=BOT_TOKEN,
+        session=benchmark_session,
+    )
+
+    broadcast_service = broadcast.BroadcastService(
+        database_manager=database_manager,
+        logger_service=logger_service,
+        aiogram_bot=aiogram_bot,
+    )
+
+    return dispatcher.AiogramDispatcher(
+        config_manager=config_manager,
+        database_manager=database_manager,
+        environment_provider=environment.EnvironmentProvider(),
+        keyboards_provider=keyboards_provider,
+        strings_provider=strings_provider,
+        logger_service=logger_service,
+        broadcast_service=broadcast_service,
+        parser_service=parser.ParserService(
+            config_manager=config_manager,
+            logger_service=logger_service,
+        ),
+        metrics_service=metrics.MetricsService(
+            config_manager=config_manager,
+            database_manager=database_manager,
+            logger_service=logger_service,
+            broadcast_service=broadcast_service,
+            aiogram_bot=aiogram_bot,
+        ),
+        aiogram_bot=aiogram_bot,
+    ), benchmark_session
+
+
+async def _post_update(
+        client_session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        url: str,
+        update: dict,
+) -> None:
+    async with semaphore:
+        while True:
+            async with client_session.post(
+                    url=url,
+                    json=update,
+                    headers={
+                        constants.WEBHOOK_SECRET_HEADER: WEBHOOK_SECRET,
+                    },
+            ) as response:
+                if response.status != 503:
+                    return
+
+            await asyncio.sleep(RETRY_INTERVAL)
+
+
+async def _measure(updates_list: list[dict], latency: float, run_mode: models.RunMode) -> None:
+    aiogram_dispatcher, benchmark_session = _create_dispatcher(
+        updates_list=[] if run_mode == models.RunMode.WEBHOOK else updates_list,
+        latency=latency,
+        run_mode=run_mode,
+    )
+
+    processed_updates_count = 0
+    completed = asyncio.Event()
+
+    async def count_middleware(handler, event, data) -> typing.Any:
+        nonlocal processed_updates_count
+
+        try:
+            return await handler(event, data)
+        finally:
+            processed_updates_count += 1
+
+            if processed_updates_count == len(updates_list):
+                completed.set()
+
+    aiogram_dispatcher.update.outer_middleware(count_middleware)
+
+    match run_mode:
+        case models.RunMode.WEBHOOK:
+            run_task = asyncio.create_task(aiogram_dispatcher.webhook_coroutine())
+
+            await benchmark_session.webhook_set.wait()
+
+            started = time.perf_counter()
+
+            semaphore = asyncio.Semaphore(WEBHOOK_CONNECTIONS)
+
+            async with aiohttp.ClientSession() as client_session:
+                await asyncio.gather(
+                    *(
+                        _post_update(
+                            client_session=client_session,
+                            semaphore=semaphore,
+                            url=f"{aiogram_dispatcher._config.settings.webhook_url}{constants.WEBHOOK_PATH}",
+                            update=update,
+                        ) for update in updates_list
+                    )
+                )
+
+                await completed.wait()
+        case _:
+            started = time.perf_counter()
+
+            run_task = asyncio.create_task(aiogram_dispatcher.polling_coroutine())
+
+            await completed.wait()
+
+    wall_time = time.perf_counter() - started
+
+    if run_mode == models.RunMode.WEBHOOK:
+        run_task.cancel()
+    else:
+        await aiogram_dispatcher.stop_polling()
+
+    await asyncio.gather(run_task, return_exceptions=True)
+
+    print(
+        f"{run_mode:>7} | "
+        f"updates {len(updates_list):>7} | "
+        f"wall time {wall_time:8.2f} s | "
+        f"throughput {len(updates_list) / wall_time:9.1f} updates/s"
+    )
+
+
+async def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("path", type=pathlib.Path, nargs="?")
+    argument_parser.add_argument("--count", type=int, default=5000)
+    argument_parser.add_argument("--latency", type=float, default=0.05)
+    arguments = argument_parser.parse_args()
+
+    if arguments.path:
+        updates_list = [
+            json.loads(line) for line in arguments.path.read_text(encoding="utf-8").splitlines() if line
+        ]
+    else:
+        updates_list = _get_synthetic_updates_list(arguments.count)
+
+    os.environ["TELEGRAM_BOT_TOKEN"] = BOT_TOKEN
+    os.environ["TELEGRAM_WEBHOOK_SECRET"] = WEBHOOK_SECRET
+
+    for run_mode in models.RunMode:
+        with tempfile.TemporaryDirectory() as directory:
+            shutil.copy(CONFIG_PATH, directory)
+            os.chdir(directory)
+
+            await _measure(updates_list, arguments.latency, run_mode)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+import argparse
+import concurrent.futures
+import pathlib
+import resource
+import time
+
+from elkollege_schedule_bot.services import parser
+
+
+def _measure(data: bytes, read_only: bool, substitutions: bool) -> tuple[float, int, int]:
+    parse_function = parser._parse_substitutions if substitutions else parser._parse_schedule
+
+    initial_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+
+    parse_function(data, read_only)
+
+    return (
+        time.perf_counter() - started,
+        initial_rss,
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    )
+
+
+def main() -> None:
+    argument_parser = argparse.ArgumentParser()
+    argument_parser.add_argument("path", type=pathlib.Path)
+    argument_parser.add_argument("--substitutions", action="store_true")
+    arguments = argument_parser.parse_args()
+
+    data = arguments.path.read_bytes()
+
+    print(f"{arguments.path.name}: {len(data) / 1024:.1f} KiB")
+
+    for read_only in (False, True):
+        with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+            wall_time, initial_rss, peak_rss = executor.submit(
+                _measure,
+                data,
+                read_only,
+                arguments.substitutions,
+            ).result()
+
+        print(
+            f"{"read-only" if read_only else "full":>9} | "
+            f"wall time {wall_time * 1000:9.1f} ms | "
+            f"peak RSS {peak_rss / 1024:8.1f} MiB | "
+            f"parsing RSS {(peak_rss - initial_rss) / 1024:8.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
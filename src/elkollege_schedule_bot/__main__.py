@@ -11,7 +11,10 @@ from .providers import buttons
 from .providers import environment
 from .providers import keyboards
 from .providers import strings
+from .services import broadcast
 from .services import logger
+from .services import metrics
+from .services import parser
 
 
 async def main() -> None:
@@ -36,16 +39,36 @@ async def main() -> None:
             parse_mode=aiogram.enums.ParseMode.HTML,
         ),
     )
+    broadcast_service = broadcast.BroadcastService(
+        database_manager=database_manager,
+        logger_service=aiogram_dispatcher_logger,
+        aiogram_bot=aiogram_bot,
+    )
+    parser_service = parser.ParserService(
+        config_manager=config_manager,
+        logger_service=aiogram_dispatcher_logger,
+    )
+    metrics_service = metrics.MetricsService(
+        config_manager=config_manager,
+        database_manager=database_manager,
+        logger_service=aiogram_dispatcher_logger,
+        broadcast_service=broadcast_service,
+        aiogram_bot=aiogram_bot,
+    )
     aiogram_dispatcher = dispatcher.AiogramDispatcher(
         config_manager=config_manager,
         database_manager=database_manager,
+        environment_provider=environment_provider,
         keyboards_provider=keyboards_provider,
         strings_provider=strings_provider,
         logger_service=aiogram_dispatcher_logger,
+        broadcast_service=broadcast_service,
+        parser_service=parser_service,
+        metrics_service=metrics_service,
         aiogram_bot=aiogram_bot,
     )
 
-    await aiogram_dispatcher.polling_coroutine()
+    await aiogram_dispatcher.run_coroutine()
 
 
 if __name__ == "__main__":
@@ -1,15 +1,63 @@
 import aiogram.exceptions
 
-TEMP_BUILDING_ID = 1  # TODO: implement academic buildings support
+DEFAULT_BUILDING_ID = 1
 
+BUILDINGS_PER_ROW = 1
 FIRST_PAGE = 1
 GROUPS_PER_PAGE = 5
 GROUPS_PER_ROW = 1
+PERIODS_PER_ROW = 4
 SCHEDULE_DAYS = 3
 SETTINGS_PER_ROW = 1
+TEACHERS_PER_PAGE = 5
+TEACHERS_PER_ROW = 1
+
+DATABASE_CACHE_SIZE = 8192
+
+SCHEDULE_MESSAGES_CACHE_SIZE = 2048
+SCHEDULES_CACHE_SIZE = 16
+STATES_CACHE_SIZE = 4096
+SUBSTITUTIONS_INDEXES_CACHE_SIZE = 64
+USERS_CACHE_SIZE = 4096
+
+ROOMS_SLOTS_PER_WEEKDAY = 32
+
+TEACHER_ID_DIGEST_SIZE = 4
+
+STATES_FLUSH_INTERVAL = 1
+STATES_FLUSH_SIZE = 100
+STATES_TTL = 24 * 60 * 60
+
+BROADCAST_CHAT_RATE = 1
+BROADCAST_CHATS_LIMIT = 10000
+BROADCAST_COMPACTION_BATCH_SIZE = 500
+BROADCAST_FLUSH_INTERVAL = 1
+BROADCAST_FLUSH_SIZE = 100
+BROADCAST_GLOBAL_RATE = 25
+BROADCAST_MAX_ATTEMPTS = 5
+BROADCAST_WORKERS = 8
+
+WEBHOOK_PATH = "/webhook"
+WEBHOOK_SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+WEBHOOK_WORKERS = 16
+
+LOGGING_BACKUP_COUNT = 10
+LOGGING_CHUNK_SIZE = 1024 * 1024
+LOGGING_EXPORT_PERIODS = (1, 24, 168, 0)
+LOGGING_MAX_SIZE = 10 * 1024 * 1024
+LOGGING_PERIODS_PER_ROW = 2
+LOGGING_QUEUE_SIZE = 10000
+LOGGING_SAMPLED_RATE = 10
+
+METRICS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4"
+METRICS_NAMESPACE = "elkollege_schedule_bot"
+METRICS_PATH = "/metrics"
 
 CALL_DATA_SEPARATOR = " "
 
+DOCUMENT_MAX_SIZE = 50 * 1024 * 1024
+
 DATE_FORMAT_READABLE = "%d.%m.%y"
 DATE_FORMAT_STARTED = "%d.%m.%y %H:%M:%S"
 
@@ -17,5 +65,9 @@ IGNORED_EXCEPTIONS = (
     aiogram.exceptions.TelegramForbiddenError,
     aiogram.exceptions.TelegramRetryAfter,
 )
+READ_ONLY_FALLBACK_EXCEPTIONS = (
+    AttributeError,
+    TimeoutError,
+)
 
 SOURCE_CODE_URL = "https://github.com/elkollege/ElkollegeScheduleBot/"
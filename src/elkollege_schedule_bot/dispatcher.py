@@ -1,14 +1,26 @@
+import asyncio
+import json
+import secrets
+import signal
+
 import aiogram
+import aiohttp.web
+import pydantic
 
 from . import constants
+from . import models
 from .managers import config
 from .managers import database
+from .providers import environment
 from .providers import keyboards
 from .providers import strings
 from .routers import callbacks
 from .routers import commands
 from .routers import messages
+from .services import broadcast
 from .services import logger
+from .services import metrics
+from .services import parser
 
 
 class AiogramDispatcher(aiogram.Dispatcher):
@@ -27,20 +39,33 @@ class AiogramDispatcher(aiogram.Dispatcher):
             self,
             config_manager: config.ConfigManager,
             database_manager: database.DatabaseManager,
+            environment_provider: environment.EnvironmentProvider,
             keyboards_provider: keyboards.KeyboardsProvider,
             strings_provider: strings.StringsProvider,
             logger_service: logger.LoggerService,
+            broadcast_service: broadcast.BroadcastService,
+            parser_service: parser.ParserService,
+            metrics_service: metrics.MetricsService,
             aiogram_bot: aiogram.Bot,
     ) -> None:
         self._config = config_manager
         self._database = database_manager
+        self._environment = environment_provider
         self._keyboards = keyboards_provider
         self._strings = strings_provider
         self._logger = logger_service
+        self._broadcast = broadcast_service
+        self._parser = parser_service
+        self._metrics = metrics_service
         self._bot = aiogram_bot
 
+        self._states_storage = database.StatesStorage(
+            database_manager=database_manager,
+        )
+
         super().__init__(
             name=self.__class__.__name__,
+            storage=self._states_storage,
         )
 
         self.startup.register(
@@ -62,6 +87,9 @@ class AiogramDispatcher(aiogram.Dispatcher):
                 keyboards_provider=keyboards_provider,
                 strings_provider=strings_provider,
                 logger_service=logger_service,
+                broadcast_service=broadcast_service,
+                parser_service=parser_service,
+                metrics_service=metrics_service,
                 aiogram_bot=aiogram_bot,
             ),
             commands.CommandsRouter(
@@ -70,6 +98,9 @@ class AiogramDispatcher(aiogram.Dispatcher):
                 keyboards_provider=keyboards_provider,
                 strings_provider=strings_provider,
                 logger_service=logger_service,
+                broadcast_service=broadcast_service,
+                parser_service=parser_service,
+                metrics_service=metrics_service,
                 aiogram_bot=aiogram_bot,
             ),
             messages.MessagesRouter(
@@ -78,6 +109,9 @@ class AiogramDispatcher(aiogram.Dispatcher):
                 keyboards_provider=keyboards_provider,
                 strings_provider=strings_provider,
                 logger_service=logger_service,
+                broadcast_service=broadcast_service,
+                parser_service=parser_service,
+                metrics_service=metrics_service,
                 aiogram_bot=aiogram_bot,
             ),
         )
@@ -86,6 +120,13 @@ class AiogramDispatcher(aiogram.Dispatcher):
 
     # region Helpers
 
+    async def run_coroutine(self) -> None:
+        match self._config.settings.run_mode:
+            case models.RunMode.WEBHOOK:
+                await self.webhook_coroutine()
+            case _:
+                await self.polling_coroutine()
+
     async def polling_coroutine(self) -> None:
         try:
             await self._bot.delete_webhook(
@@ -96,6 +137,114 @@ class AiogramDispatcher(aiogram.Dispatcher):
         except Exception as exception:
             self._logger.log_exception(exception)
 
+    async def webhook_coroutine(self) -> None:
+        if not self._environment.TELEGRAM_WEBHOOK_SECRET:
+            raise ValueError("TELEGRAM_WEBHOOK_SECRET must be set in webhook mode")
+
+        updates_queue: asyncio.Queue[aiogram.types.Update] = asyncio.Queue(
+            maxsize=self._config.settings.webhook_queue_size,
+        )
+
+        application = aiohttp.web.Application()
+        application.router.add_post(
+            path=constants.WEBHOOK_PATH,
+            handler=lambda request: self._webhook_handler(request, updates_queue),
+        )
+        application_runner = aiohttp.web.AppRunner(application)
+
+        stop_event = asyncio.Event()
+
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            asyncio.get_running_loop().add_signal_handler(signal_number, stop_event.set)
+
+        workers = [
+            asyncio.create_task(
+                self._webhook_worker(updates_queue),
+            ) for _ in range(constants.WEBHOOK_WORKERS)
+        ]
+
+        try:
+            await self.emit_startup(bot=self._bot)
+
+            await application_runner.setup()
+            await aiohttp.web.TCPSite(
+                runner=application_runner,
+                host=self._config.settings.webhook_host,
+                port=self._config.settings.webhook_port,
+            ).start()
+
+            await self._bot.set_webhook(
+                url=f"{self._config.settings.webhook_url}{constants.WEBHOOK_PATH}",
+                allowed_updates=self.resolve_used_update_types(),
+                drop_pending_updates=self._config.settings.skip_updates,
+                secret_token=self._environment.TELEGRAM_WEBHOOK_SECRET,
+            )
+
+            self._logger.log_event(
+                self.webhook_coroutine.__name__,
+                host=self._config.settings.webhook_host,
+                port=self._config.settings.webhook_port,
+            )
+
+            await stop_event.wait()
+        except Exception as exception:
+            self._logger.log_exception(exception)
+        finally:
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                asyncio.get_running_loop().remove_signal_handler(signal_number)
+
+            await application_runner.cleanup()
+
+            for worker in workers:
+                worker.cancel()
+
+            await asyncio.gather(*workers, return_exceptions=True)
+
+            await self.emit_shutdown(bot=self._bot)
+
+    # endregion
+
+    # region Webhook
+
+    async def _webhook_handler(
+            self,
+            request: aiohttp.web.Request,
+            updates_queue: asyncio.Queue[aiogram.types.Update],
+    ) -> aiohttp.web.Response:
+        if not secrets.compare_digest(
+                request.headers.get(constants.WEBHOOK_SECRET_HEADER, "").encode(),
+                self._environment.TELEGRAM_WEBHOOK_SECRET.encode(),
+        ):
+            return aiohttp.web.Response(status=401)
+
+        try:
+            update = aiogram.types.Update.model_validate(
+                await request.json(),
+                context={
+                    "bot": self._bot,
+                },
+            )
+        except (UnicodeDecodeError, json.JSONDecodeError, pydantic.ValidationError):
+            return aiohttp.web.Response(status=400)
+
+        try:
+            updates_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            return aiohttp.web.Response(status=503)
+
+        return aiohttp.web.Response()
+
+    async def _webhook_worker(self, updates_queue: asyncio.Queue[aiogram.types.Update]) -> None:
+        while True:
+            update = await updates_queue.get()
+
+            try:
+                await self.feed_update(self._bot, update)
+            except Exception as exception:
+                self._logger.log_exception(exception)
+            finally:
+                updates_queue.task_done()
+
     # endregion
 
     # region Handlers
@@ -106,6 +255,9 @@ class AiogramDispatcher(aiogram.Dispatcher):
             scope=aiogram.types.BotCommandScopeDefault(),
         )
 
+        await self._broadcast.resume()
+        await self._metrics.start()
+
         self._logger.info(f"{self.name} started!")
 
     async def _error_handler(self, event: aiogram.types.ErrorEvent) -> None:
@@ -113,6 +265,14 @@ class AiogramDispatcher(aiogram.Dispatcher):
             self._logger.log_exception(event.exception)
 
     async def _shutdown_handler(self) -> None:
+        await self._broadcast.close()
+        await self._metrics.close()
+        await self._states_storage.close()
+
+        self._parser.close()
+
         self._logger.info(f"{self.name} terminated")
 
+        self._logger.close()
+
     # endregion
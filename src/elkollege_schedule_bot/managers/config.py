@@ -9,7 +9,19 @@ class SettingsConfig(pyquoks.managers.config.Config):
     _SECTION = "Settings"
 
     admins_list: list
+    buildings_list: list
     contact_developer: str
     file_logging: bool
+    metrics: bool
+    metrics_host: str
+    metrics_port: int
+    parsing_memory_limit: int
+    parsing_timeout: int
+    run_mode: str
     skip_updates: bool
+    webhook_host: str
+    webhook_port: int
+    webhook_queue_size: int
+    webhook_url: str
     workbook_extension: str
+    workbook_read_only: bool
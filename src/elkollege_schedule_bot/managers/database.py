@@ -1,119 +1,1516 @@
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
+import json
+import time
+import typing
+
+import aiogram.fsm.state
+import aiogram.fsm.storage.base
 import pyquoks.managers.database
 import pyquoks.utils
+import schedule_parser.models
+
+from .. import constants
+from .. import models
+from .. import serializers
+from .. import utils
+
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1,
+    thread_name_prefix="Database",
+)
+
+_query_durations = utils.Histogram(
+    buckets=constants.METRICS_BUCKETS,
+)
+
+
+def _timed[**P, R](method: typing.Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+    started = time.perf_counter()
+
+    try:
+        return method(*args, **kwargs)
+    finally:
+        _query_durations.observe(
+            labels=(
+                args[0]._NAME,
+                method.__name__,
+            ),
+            value=time.perf_counter() - started,
+        )
+
+
+def _threaded[**P, R](
+        method: typing.Callable[P, R],
+) -> typing.Callable[P, typing.Coroutine[typing.Any, typing.Any, R]]:
+    @functools.wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor,
+            functools.partial(_timed, method, *args, **kwargs),
+        )
+
+    return wrapper
+
+
+class DatabaseManager(pyquoks.managers.database.DatabaseManager):
+    broadcasts: BroadcastsDatabase
+    schedules: SchedulesDatabase
+    states: StatesDatabase
+    substitutions: SubstitutionsDatabase
+    users: UsersDatabase
+
+    def __init__(self) -> None:
+        _executor.submit(super().__init__).result()
+
+    @property
+    def query_durations(self) -> utils.Histogram:
+        return _query_durations
+
+
+class Database(pyquoks.managers.database.Database):
+    _PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        f"PRAGMA cache_size = {-constants.DATABASE_CACHE_SIZE}",
+    )
+
+    _COLUMNS: dict[str, str] = {}
+
+    _MIGRATIONS: tuple[str, ...] = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        cursor = self.cursor()
+
+        for statement in self._PRAGMAS:
+            cursor.execute(statement)
+
+        columns_set = self._get_columns_set()
+
+        for name, definition in self._COLUMNS.items():
+            if name not in columns_set:
+                cursor.execute(
+                    pyquoks.utils.format_multiline_string(
+                        f"""
+                            ALTER TABLE {self._NAME} ADD COLUMN {name} {definition}
+                        """,
+                    ),
+                )
+
+        for statement in self._MIGRATIONS:
+            cursor.execute(statement)
+
+        self.commit()
+
+    def _get_columns_set(self) -> set[str]:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    PRAGMA table_info({self._NAME})
+                """,
+            ),
+        )
+
+        return {
+            result["name"] for result in cursor.fetchall()
+        }
+
+
+class BroadcastsDatabase(Database):
+    _NAME = "broadcasts"
+
+    _SQL = pyquoks.utils.format_multiline_string(
+        f"""
+            CREATE TABLE IF NOT EXISTS {_NAME} (
+            id INTEGER PRIMARY KEY NOT NULL,
+            job_id TEXT NOT NULL,
+            chat_id INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            reply_markup_json_string TEXT,
+            state TEXT NOT NULL
+            )
+        """,
+    )
+
+    _MIGRATIONS = (
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE INDEX IF NOT EXISTS {_NAME}_state ON {_NAME} (state)
+            """,
+        ),
+    )
+
+    @_threaded
+    def add_messages(
+            self,
+            job_id: str,
+            messages_list: list[models.BroadcastMessage],
+    ) -> list[models.DatabaseBroadcastMessage]:
+        cursor = self.cursor()
+
+        database_messages_list = []
+
+        for message in messages_list:
+            reply_markup_json_string = message.reply_markup.model_dump_json(
+                exclude_none=True,
+            ) if message.reply_markup else None
+
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        INSERT INTO {self._NAME} (
+                        job_id,
+                        chat_id,
+                        text,
+                        reply_markup_json_string,
+                        state
+                        )
+                        VALUES (?, ?, ?, ?, ?)
+                    """,
+                ),
+                (
+                    job_id,
+                    message.chat_id,
+                    message.text,
+                    reply_markup_json_string,
+                    models.BroadcastState.PENDING,
+                ),
+            )
+
+            database_messages_list.append(
+                models.DatabaseBroadcastMessage(
+                    id=cursor.lastrowid,
+                    job_id=job_id,
+                    chat_id=message.chat_id,
+                    text=message.text,
+                    reply_markup_json_string=reply_markup_json_string,
+                    state=models.BroadcastState.PENDING,
+                ),
+            )
+
+        self.commit()
+
+        return database_messages_list
+
+    @_threaded
+    def get_pending_messages_list(self) -> list[models.DatabaseBroadcastMessage]:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT * FROM {self._NAME} WHERE state = ? ORDER BY id
+                """,
+            ),
+            (
+                models.BroadcastState.PENDING,
+            ),
+        )
+        results = cursor.fetchall()
+
+        return [models.DatabaseBroadcastMessage.model_validate(dict(result)) for result in results]
+
+    @_threaded
+    def edit_states(self, states: dict[int, models.BroadcastState]) -> None:
+        cursor = self.cursor()
+
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    UPDATE {self._NAME} SET state = ? WHERE id = ?
+                """,
+            ),
+            [
+                (
+                    state,
+                    _id,
+                ) for _id, state in states.items()
+            ],
+        )
+
+        self.commit()
+
+    @_threaded
+    def delete_completed_messages(self, limit: int) -> int:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._NAME} WHERE id IN (
+                    SELECT id FROM {self._NAME} WHERE state != ? LIMIT ?
+                    )
+                """,
+            ),
+            (
+                models.BroadcastState.PENDING,
+                limit,
+            ),
+        )
+
+        self.commit()
+
+        return cursor.rowcount
+
+
+class SchedulesDatabase(Database):
+    _NAME = "schedules"
+    _GROUPS_NAME = f"{_NAME}_groups"
+    _DAYS_NAME = f"{_NAME}_days"
+    _PERIODS_NAME = f"{_NAME}_periods"
+
+    _SQL = pyquoks.utils.format_multiline_string(
+        f"""
+            CREATE TABLE IF NOT EXISTS {_NAME} (
+            id INTEGER PRIMARY KEY NOT NULL,
+            building_id INTEGER NOT NULL,
+            data BLOB NOT NULL,
+            groups_count INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            uploaded_at INTEGER,
+            uploader_id INTEGER
+            )
+        """,
+    )
+
+    _COLUMNS = {
+        "groups_count": "INTEGER",
+        "size": "INTEGER",
+        "uploaded_at": "INTEGER",
+        "uploader_id": "INTEGER",
+    }
+
+    _MIGRATIONS = (
+        pyquoks.utils.format_multiline_string(
+            f"""
+                DELETE FROM {_NAME} WHERE id NOT IN (
+                SELECT MAX(id) FROM {_NAME} GROUP BY building_id
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE UNIQUE INDEX IF NOT EXISTS {_NAME}_building_id ON {_NAME} (building_id)
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE TABLE IF NOT EXISTS {_GROUPS_NAME} (
+                id INTEGER PRIMARY KEY NOT NULL,
+                building_id INTEGER NOT NULL,
+                group_name TEXT NOT NULL
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE UNIQUE INDEX IF NOT EXISTS {_GROUPS_NAME}_building_id_group_name ON {_GROUPS_NAME} (building_id, group_name)
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE TABLE IF NOT EXISTS {_DAYS_NAME} (
+                id INTEGER PRIMARY KEY NOT NULL,
+                group_id INTEGER NOT NULL,
+                weekday INTEGER NOT NULL,
+                json_string TEXT NOT NULL
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE UNIQUE INDEX IF NOT EXISTS {_DAYS_NAME}_group_id_weekday ON {_DAYS_NAME} (group_id, weekday)
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE TABLE IF NOT EXISTS {_PERIODS_NAME} (
+                id INTEGER PRIMARY KEY NOT NULL,
+                day_id INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                json_string TEXT NOT NULL
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE INDEX IF NOT EXISTS {_PERIODS_NAME}_day_id_position ON {_PERIODS_NAME} (day_id, position)
+            """,
+        ),
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._group_names: dict[int, tuple[str, ...]] = {}
+        self._teachers: dict[int, dict[str, dict[int, tuple[models.TeacherPeriod, ...]]]] = {}
+        self._teacher_names: dict[int, tuple[str, ...]] = {}
+        self._teacher_ids: dict[int, dict[str, str]] = {}
+        self._rooms: dict[int, dict[str, int]] = {}
+        self._slots: dict[int, dict[tuple[int, int], dict[str, set[str]]]] = {}
+        self._period_numbers: dict[int, tuple[int, ...]] = {}
+        self._skipped_periods: dict[int, int] = {}
+
+        self._migrate_json_strings()
+        self._migrate_metadata()
+        self._migrate_groups()
+
+        self._load_group_names()
+        self._load_indexes()
+
+        self._cache: utils.LRUCache[int, models.DatabaseSchedule] = utils.LRUCache(
+            max_size=constants.SCHEDULES_CACHE_SIZE,
+        )
+        self._versions: dict[int, int] = {}
+        self._group_versions: dict[tuple[int, str], int] = {}
+
+    @property
+    def cache_info(self) -> models.CacheInfo:
+        return self._cache.cache_info
+
+    def get_version(self, building_id: int) -> int:
+        return self._versions.get(building_id, 0)
+
+    def get_group_version(self, building_id: int, group_name: str) -> int:
+        return self._group_versions.get((building_id, group_name), 0)
+
+    def get_group_names(self, building_id: int) -> tuple[str, ...] | None:
+        return self._group_names.get(building_id)
+
+    def get_teacher_names(self, building_id: int) -> tuple[str, ...] | None:
+        return self._teacher_names.get(building_id)
+
+    def get_teacher_name(self, building_id: int, teacher_id: str) -> str | None:
+        return self._teacher_ids.get(building_id, {}).get(teacher_id)
+
+    def get_teacher_periods(self, building_id: int, teacher_name: str, weekday: int) -> tuple[models.TeacherPeriod, ...]:
+        return self._teachers.get(building_id, {}).get(teacher_name, {}).get(weekday, ())
+
+    def get_period_numbers(self, building_id: int) -> tuple[int, ...] | None:
+        return self._period_numbers.get(building_id)
+
+    def get_skipped_periods_count(self, building_id: int) -> int:
+        return self._skipped_periods.get(building_id, 0)
+
+    def get_free_rooms(
+            self,
+            building_id: int,
+            weekday: int,
+            number: int,
+            substitutions_index: models.SubstitutionsIndex,
+    ) -> tuple[str, ...]:
+        rooms_dict = self._rooms.get(building_id, {})
+
+        if not self._is_slot_number(number):
+            return ()
+
+        if substituted_rooms := substitutions_index.rooms_dict.get(number):
+            occupied_rooms = set().union(
+                *{
+                    **self._slots.get(building_id, {}).get((weekday, number), {}),
+                    **substituted_rooms,
+                }.values(),
+            )
+        else:
+            slot_bit = self._get_slot_bit(weekday, number)
+
+            occupied_rooms = {
+                room for room, occupancy in rooms_dict.items() if occupancy & slot_bit
+            }
+
+        return tuple(
+            room for room in rooms_dict if room not in occupied_rooms
+        )
+
+    def _migrate_json_strings(self) -> None:
+        columns_set = self._get_columns_set()
+
+        if "json_string" not in columns_set:
+            return
+
+        cursor = self.cursor()
+
+        if "data" not in columns_set:
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        ALTER TABLE {self._NAME} ADD COLUMN data BLOB
+                    """,
+                ),
+            )
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT id, json_string FROM {self._NAME}
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        UPDATE {self._NAME} SET data = ? WHERE id = ?
+                    """,
+                ),
+                (
+                    models.DatabaseSchedule.pack_groups_list(
+                        [
+                            schedule_parser.models.GroupSchedule.model_validate(
+                                group_schedule,
+                            ) for group_schedule in json.loads(result["json_string"])
+                        ],
+                    ),
+                    result["id"],
+                ),
+            )
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    ALTER TABLE {self._NAME} DROP COLUMN json_string
+                """,
+            ),
+        )
+
+        self.commit()
+
+    def _migrate_metadata(self) -> None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT id, data FROM {self._NAME} WHERE groups_count IS NULL OR size IS NULL
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        UPDATE {self._NAME} SET groups_count = ?, size = ? WHERE id = ?
+                    """,
+                ),
+                (
+                    len(serializers.PackedSegments(result["data"])),
+                    len(result["data"]),
+                    result["id"],
+                ),
+            )
+
+        self.commit()
+
+    def _migrate_groups(self) -> None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT building_id, data FROM {self._NAME} WHERE building_id NOT IN (
+                    SELECT building_id FROM {self._GROUPS_NAME}
+                    )
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            self._replace_groups(
+                building_id=result["building_id"],
+                data=result["data"],
+            )
+
+        self.commit()
+
+    def _load_group_names(self) -> None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT building_id FROM {self._NAME}
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            self._group_names[result["building_id"]] = ()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT building_id, group_name FROM {self._GROUPS_NAME} ORDER BY building_id, group_name
+                """,
+            ),
+        )
+
+        for building_id, results in itertools.groupby(cursor.fetchall(), key=lambda result: result["building_id"]):
+            self._group_names[building_id] = tuple(
+                result["group_name"] for result in results
+            )
+
+    def _load_indexes(self) -> None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT building_id FROM {self._NAME}
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            self._set_indexes(
+                building_id=result["building_id"],
+                teacher_periods=[],
+            )
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT {self._GROUPS_NAME}.building_id, {self._GROUPS_NAME}.group_name, {self._DAYS_NAME}.weekday, {self._PERIODS_NAME}.json_string
+                    FROM {self._PERIODS_NAME}
+                    JOIN {self._DAYS_NAME} ON {self._DAYS_NAME}.id = {self._PERIODS_NAME}.day_id
+                    JOIN {self._GROUPS_NAME} ON {self._GROUPS_NAME}.id = {self._DAYS_NAME}.group_id
+                    ORDER BY {self._GROUPS_NAME}.building_id, {self._PERIODS_NAME}.position
+                """,
+            ),
+        )
+
+        for building_id, results in itertools.groupby(cursor.fetchall(), key=lambda result: result["building_id"]):
+            self._set_indexes(
+                building_id=building_id,
+                teacher_periods=[
+                    (
+                        result["weekday"],
+                        models.TeacherPeriod(
+                            group_name=result["group_name"],
+                            period=schedule_parser.models.Period.model_validate_json(result["json_string"]),
+                        ),
+                    ) for result in results
+                ],
+            )
+
+    @staticmethod
+    def _is_slot_number(number: int) -> bool:
+        return 0 <= number < constants.ROOMS_SLOTS_PER_WEEKDAY
+
+    @staticmethod
+    def _get_slot_bit(weekday: int, number: int) -> int:
+        return 1 << (weekday * constants.ROOMS_SLOTS_PER_WEEKDAY + number)
+
+    def _set_indexes(self, building_id: int, teacher_periods: list[tuple[int, models.TeacherPeriod]]) -> None:
+        teachers_dict = collections.defaultdict(lambda: collections.defaultdict(list))
+        rooms_dict = collections.defaultdict(int)
+        slots_dict = collections.defaultdict(lambda: collections.defaultdict(set))
+        skipped_periods_count = 0
+
+        for weekday, teacher_period in teacher_periods:
+            if teacher_period.period.teacher:
+                teachers_dict[teacher_period.period.teacher][weekday].append(teacher_period)
+
+            if not self._is_slot_number(teacher_period.period.number):
+                skipped_periods_count += 1
+            elif teacher_period.period.room:
+                rooms_dict[teacher_period.period.room] |= self._get_slot_bit(weekday, teacher_period.period.number)
+                slots_dict[(weekday, teacher_period.period.number)][teacher_period.group_name].add(
+                    teacher_period.period.room,
+                )
+
+        self._teachers[building_id] = {
+            teacher_name: {
+                weekday: tuple(
+                    sorted(weekday_periods, key=lambda teacher_period: teacher_period.period.number)
+                ) for weekday, weekday_periods in weekdays_dict.items()
+            } for teacher_name, weekdays_dict in teachers_dict.items()
+        }
+        self._teacher_names[building_id] = tuple(sorted(self._teachers[building_id]))
+        self._teacher_ids[building_id] = {
+            utils.get_teacher_id(teacher_name): teacher_name for teacher_name in self._teacher_names[building_id]
+        }
+        self._rooms[building_id] = {
+            room: rooms_dict[room] for room in sorted(rooms_dict)
+        }
+        self._slots[building_id] = {
+            slot: dict(groups_dict) for slot, groups_dict in slots_dict.items()
+        }
+        self._period_numbers[building_id] = tuple(sorted({number for _, number in slots_dict}))
+        self._skipped_periods[building_id] = skipped_periods_count
+
+    def _delete_indexes(self, building_id: int) -> None:
+        self._group_names.pop(building_id, None)
+        self._teachers.pop(building_id, None)
+        self._teacher_names.pop(building_id, None)
+        self._teacher_ids.pop(building_id, None)
+        self._rooms.pop(building_id, None)
+        self._slots.pop(building_id, None)
+        self._period_numbers.pop(building_id, None)
+        self._skipped_periods.pop(building_id, None)
+
+    def _delete_groups(self, building_id: int, group_names: typing.Iterable[str]) -> None:
+        cursor = self.cursor()
+
+        params_list = [
+            (
+                building_id,
+                group_name,
+            ) for group_name in group_names
+        ]
+
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._PERIODS_NAME} WHERE day_id IN (
+                    SELECT {self._DAYS_NAME}.id FROM {self._DAYS_NAME}
+                    JOIN {self._GROUPS_NAME} ON {self._GROUPS_NAME}.id = {self._DAYS_NAME}.group_id
+                    WHERE {self._GROUPS_NAME}.building_id = ? AND {self._GROUPS_NAME}.group_name = ?
+                    )
+                """,
+            ),
+            params_list,
+        )
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._DAYS_NAME} WHERE group_id IN (
+                    SELECT id FROM {self._GROUPS_NAME} WHERE building_id = ? AND group_name = ?
+                    )
+                """,
+            ),
+            params_list,
+        )
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._GROUPS_NAME} WHERE building_id = ? AND group_name = ?
+                """,
+            ),
+            params_list,
+        )
+
+    def _replace_groups(
+            self,
+            building_id: int,
+            groups_list: list[schedule_parser.models.GroupSchedule],
+            schedule_diff: models.ScheduleDiff | None = None,
+    ) -> None:
+        if schedule_diff is not None:
+            changed_group_names = schedule_diff.group_names
+        else:
+            changed_group_names = {
+                *self._group_names.get(building_id, ()),
+                *(group_schedule.group_name for group_schedule in groups_list),
+            }
+
+        self._delete_groups(
+            building_id=building_id,
+            group_names=changed_group_names,
+        )
+
+        cursor = self.cursor()
+
+        for group_schedule in groups_list:
+            if group_schedule.group_name not in changed_group_names:
+                continue
+
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        INSERT INTO {self._GROUPS_NAME} (
+                        building_id,
+                        group_name
+                        )
+                        VALUES (?, ?)
+                    """,
+                ),
+                (
+                    building_id,
+                    group_schedule.group_name,
+                ),
+            )
+            group_id = cursor.lastrowid
+
+            for weekday, day_schedule in models.DatabaseSchedule.get_days_dict(group_schedule).items():
+                cursor.execute(
+                    pyquoks.utils.format_multiline_string(
+                        f"""
+                            INSERT INTO {self._DAYS_NAME} (
+                            group_id,
+                            weekday,
+                            json_string
+                            )
+                            VALUES (?, ?, ?)
+                        """,
+                    ),
+                    (
+                        group_id,
+                        weekday,
+                        day_schedule.model_dump_json(
+                            exclude={
+                                "periods_list",
+                            },
+                        ),
+                    ),
+                )
+                day_id = cursor.lastrowid
+
+                cursor.executemany(
+                    pyquoks.utils.format_multiline_string(
+                        f"""
+                            INSERT INTO {self._PERIODS_NAME} (
+                            day_id,
+                            position,
+                            json_string
+                            )
+                            VALUES (?, ?, ?)
+                        """,
+                    ),
+                    [
+                        (
+                            day_id,
+                            position,
+                            period.model_dump_json(),
+                        ) for position, period in enumerate(day_schedule.periods_list)
+                    ],
+                )
+
+    def _update_indexes(self, building_id: int, groups_list: list[schedule_parser.models.GroupSchedule]) -> None:
+        self._group_names[building_id] = tuple(
+            sorted(group_schedule.group_name for group_schedule in groups_list)
+        )
+
+        self._set_indexes(
+            building_id=building_id,
+            teacher_periods=[
+                (
+                    weekday,
+                    models.TeacherPeriod(
+                        group_name=group_schedule.group_name,
+                        period=period,
+                    ),
+                ) for group_schedule in groups_list
+                for weekday, day_schedule in models.DatabaseSchedule.get_days_dict(group_schedule).items()
+                for period in day_schedule.periods_list
+            ],
+        )
+
+    def _invalidate_cache(self, building_id: int, group_names: typing.Iterable[str] | None = None) -> None:
+        self._cache.pop(building_id)
+
+        if group_names is None:
+            self._versions[building_id] = self.get_version(building_id) + 1
+        else:
+            for group_name in group_names:
+                self._group_versions[(building_id, group_name)] = self.get_group_version(building_id, group_name) + 1
+
+    @_threaded
+    def add_schedule(self, building_id: int, data: bytes, uploader_id: int) -> None:
+        groups_list = models.DatabaseSchedule.unpack_groups_list(data)
+
+        cursor = self.cursor()
+
+        try:
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        INSERT INTO {self._NAME} (
+                        building_id,
+                        data,
+                        groups_count,
+                        size,
+                        uploaded_at,
+                        uploader_id
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                ),
+                (
+                    building_id,
+                    data,
+                    len(groups_list),
+                    len(data),
+                    int(time.time()),
+                    uploader_id,
+                ),
+            )
+
+            self._replace_groups(
+                building_id=building_id,
+                groups_list=groups_list,
+            )
+
+            self.commit()
+        except Exception:
+            self.rollback()
+
+            raise
+
+        self._update_indexes(
+            building_id=building_id,
+            groups_list=groups_list,
+        )
+        self._invalidate_cache(building_id)
+
+    def _select_schedule(self, building_id: int) -> models.DatabaseSchedule | None:
+        if cached_schedule := self._cache.get(building_id):
+            return cached_schedule
+
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT * FROM {self._NAME} WHERE building_id = ?
+                """,
+            ),
+            (
+                building_id,
+            ),
+        )
+        result = cursor.fetchone()
+
+        if result:
+            schedule = models.DatabaseSchedule.model_validate(dict(result))
+
+            self._cache.set(building_id, schedule)
+
+            return schedule
+        else:
+            return None
+
+    @_threaded
+    def get_schedule(self, building_id: int) -> models.DatabaseSchedule | None:
+        return self._select_schedule(building_id)
+
+    @_threaded
+    def get_group_schedule(self, building_id: int, group_name: str) -> schedule_parser.models.GroupSchedule | None:
+        schedule = self._select_schedule(building_id)
+
+        if schedule and schedule.has_group(group_name):
+            return schedule_parser.models.GroupSchedule.model_validate(
+                schedule.packed_groups.get(group_name),
+            )
+        else:
+            return None
+
+    @_threaded
+    def get_day_schedule(self, building_id: int, group_name: str, weekday: int) -> schedule_parser.models.DaySchedule | None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT {self._DAYS_NAME}.json_string AS day_json_string, {self._PERIODS_NAME}.json_string AS period_json_string
+                    FROM {self._GROUPS_NAME}
+                    JOIN {self._DAYS_NAME} ON {self._DAYS_NAME}.group_id = {self._GROUPS_NAME}.id
+                    LEFT JOIN {self._PERIODS_NAME} ON {self._PERIODS_NAME}.day_id = {self._DAYS_NAME}.id
+                    WHERE {self._GROUPS_NAME}.building_id = ? AND {self._GROUPS_NAME}.group_name = ? AND {self._DAYS_NAME}.weekday = ?
+                    ORDER BY {self._PERIODS_NAME}.position
+                """,
+            ),
+            (
+                building_id,
+                group_name,
+                weekday,
+            ),
+        )
+        results = cursor.fetchall()
+
+        if results:
+            return schedule_parser.models.DaySchedule.model_validate(
+                {
+                    **json.loads(results[0]["day_json_string"]),
+                    "periods_list": [
+                        json.loads(result["period_json_string"]) for result in results if result["period_json_string"]
+                    ],
+                },
+            )
+        else:
+            return None
+
+    @_threaded
+    def edit_data(self, building_id: int, data: bytes, uploader_id: int) -> models.ScheduleDiff:
+        groups_list = models.DatabaseSchedule.unpack_groups_list(data)
+
+        cursor = self.cursor()
+
+        try:
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        SELECT data FROM {self._NAME} WHERE building_id = ?
+                    """,
+                ),
+                (
+                    building_id,
+                ),
+            )
+
+            schedule_diff = models.DatabaseSchedule.get_diff(
+                previous_data=cursor.fetchone()["data"],
+                data=data,
+            )
+
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        UPDATE {self._NAME} SET data = ?, groups_count = ?, size = ?, uploaded_at = ?, uploader_id = ? WHERE building_id = ?
+                    """,
+                ),
+                (
+                    data,
+                    len(groups_list),
+                    len(data),
+                    int(time.time()),
+                    uploader_id,
+                    building_id,
+                ),
+            )
+
+            self._replace_groups(
+                building_id=building_id,
+                groups_list=groups_list,
+                schedule_diff=schedule_diff,
+            )
+
+            self.commit()
+        except Exception:
+            self.rollback()
+
+            raise
+
+        self._update_indexes(
+            building_id=building_id,
+            groups_list=groups_list,
+        )
+        self._invalidate_cache(building_id, schedule_diff.group_names)
+
+        return schedule_diff
+
+    @_threaded
+    def delete_schedule(self, building_id: int) -> None:
+        cursor = self.cursor()
+
+        try:
+            cursor.execute(
+                pyquoks.utils.format_multiline_string(
+                    f"""
+                        DELETE FROM {self._NAME} WHERE building_id = ?
+                    """,
+                ),
+                (
+                    building_id,
+                ),
+            )
+
+            self._delete_groups(
+                building_id=building_id,
+                group_names=self._group_names.get(building_id, ()),
+            )
+
+            self.commit()
+        except Exception:
+            self.rollback()
+
+            raise
+
+        self._delete_indexes(building_id)
+        self._invalidate_cache(building_id)
+
+
+class StatesDatabase(Database):
+    _NAME = "states"
+
+    _SQL = pyquoks.utils.format_multiline_string(
+        f"""
+            CREATE TABLE IF NOT EXISTS {_NAME} (
+            key TEXT PRIMARY KEY NOT NULL,
+            state TEXT,
+            data_json_string TEXT NOT NULL,
+            expires_at INTEGER NOT NULL
+            )
+        """,
+    )
+
+    _MIGRATIONS = (
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE INDEX IF NOT EXISTS {_NAME}_expires_at ON {_NAME} (expires_at)
+            """,
+        ),
+    )
+
+    @_threaded
+    def get_state(self, key: str) -> models.DatabaseState | None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT * FROM {self._NAME} WHERE key = ? AND expires_at > ?
+                """,
+            ),
+            (
+                key,
+                int(time.time()),
+            ),
+        )
+        result = cursor.fetchone()
+
+        if result:
+            return models.DatabaseState.model_validate(dict(result))
+        else:
+            return None
+
+    @_threaded
+    def edit_states(self, states_list: list[models.DatabaseState]) -> None:
+        cursor = self.cursor()
+
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._NAME} WHERE key = ?
+                """,
+            ),
+            [
+                (
+                    state.key,
+                ) for state in states_list if state.is_empty
+            ],
+        )
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    INSERT INTO {self._NAME} (
+                    key,
+                    state,
+                    data_json_string,
+                    expires_at
+                    )
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (key) DO UPDATE SET
+                    state = excluded.state,
+                    data_json_string = excluded.data_json_string,
+                    expires_at = excluded.expires_at
+                """,
+            ),
+            [
+                (
+                    state.key,
+                    state.state,
+                    state.data_json_string,
+                    state.expires_at,
+                ) for state in states_list if not state.is_empty
+            ],
+        )
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    DELETE FROM {self._NAME} WHERE expires_at <= ?
+                """,
+            ),
+            (
+                int(time.time()),
+            ),
+        )
 
-from .. import constants
-from .. import models
+        self.commit()
 
 
-class DatabaseManager(pyquoks.managers.database.DatabaseManager):
-    schedules: SchedulesDatabase
-    substitutions: SubstitutionsDatabase
-    users: UsersDatabase
+class StatesStorage(aiogram.fsm.storage.base.BaseStorage):
+    def __init__(self, database_manager: DatabaseManager) -> None:
+        self._database = database_manager
+
+        self._key_builder = aiogram.fsm.storage.base.DefaultKeyBuilder(
+            with_destiny=True,
+        )
+        self._cache: utils.LRUCache[str, models.DatabaseState] = utils.LRUCache(
+            max_size=constants.STATES_CACHE_SIZE,
+        )
+        self._states: dict[str, models.DatabaseState] = {}
+        self._flush_requested = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
 
+    # region Helpers
 
-class SchedulesDatabase(pyquoks.managers.database.Database):
-    _NAME = "schedules"
+    @staticmethod
+    def _get_empty_state(key: str) -> models.DatabaseState:
+        return models.DatabaseState(
+            key=key,
+            state=None,
+            data_json_string="{}",
+            expires_at=0,
+        )
+
+    async def _get_state(self, key: aiogram.fsm.storage.base.StorageKey) -> models.DatabaseState:
+        built_key = self._key_builder.build(key)
+
+        database_state = self._states.get(built_key) or self._cache.get(built_key)
+
+        if not database_state:
+            database_state = await self._database.states.get_state(built_key) or self._get_empty_state(built_key)
+
+            self._cache.set(built_key, database_state)
+
+        if database_state.is_expired:
+            return self._get_empty_state(built_key)
+
+        return database_state
+
+    async def _set_state(
+            self,
+            key: aiogram.fsm.storage.base.StorageKey,
+            state: str | None,
+            data: dict,
+    ) -> None:
+        database_state = await self._get_state(key)
+
+        if database_state.state == state and database_state.data == data:
+            return
+
+        database_state = models.DatabaseState(
+            key=database_state.key,
+            state=state,
+            data_json_string=json.dumps(data),
+            expires_at=int(time.time()) + constants.STATES_TTL,
+        )
+
+        self._cache.set(database_state.key, database_state)
+        self._states[database_state.key] = database_state
+
+        if not self._flusher or self._flusher.done():
+            self._flusher = asyncio.create_task(
+                self._flusher_coroutine(),
+                name=f"{self.__class__.__name__}-flusher",
+            )
+
+        if len(self._states) >= constants.STATES_FLUSH_SIZE:
+            self._flush_requested.set()
+
+    async def _flush_states(self) -> None:
+        if not self._states:
+            return
+
+        states = self._states.copy()
+
+        await self._database.states.edit_states(
+            states_list=list(states.values()),
+        )
+
+        for key, database_state in states.items():
+            if self._states.get(key) is database_state:
+                del self._states[key]
+
+    async def _flusher_coroutine(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=constants.STATES_FLUSH_INTERVAL,
+                )
+            except TimeoutError:
+                pass
+
+            self._flush_requested.clear()
+
+            await self._flush_states()
+
+    # endregion
+
+    async def set_state(
+            self,
+            key: aiogram.fsm.storage.base.StorageKey,
+            state: aiogram.fsm.storage.base.StateType = None,
+    ) -> None:
+        database_state = await self._get_state(key)
+
+        await self._set_state(
+            key=key,
+            state=state.state if isinstance(state, aiogram.fsm.state.State) else state,
+            data=database_state.data,
+        )
+
+    async def get_state(self, key: aiogram.fsm.storage.base.StorageKey) -> str | None:
+        return (await self._get_state(key)).state
+
+    async def set_data(
+            self,
+            key: aiogram.fsm.storage.base.StorageKey,
+            data: typing.Mapping[str, typing.Any],
+    ) -> None:
+        database_state = await self._get_state(key)
+
+        await self._set_state(
+            key=key,
+            state=database_state.state,
+            data=dict(data),
+        )
+
+    async def get_data(self, key: aiogram.fsm.storage.base.StorageKey) -> dict[str, typing.Any]:
+        return dict((await self._get_state(key)).data)
+
+    async def close(self) -> None:
+        if self._flusher:
+            self._flusher.cancel()
+
+            await asyncio.gather(self._flusher, return_exceptions=True)
+
+            self._flusher = None
+
+        await self._flush_states()
+
+
+class SubstitutionsDatabase(Database):
+    _NAME = "substitutions"
+    _ITEMS_NAME = f"{_NAME}_items"
 
     _SQL = pyquoks.utils.format_multiline_string(
         f"""
             CREATE TABLE IF NOT EXISTS {_NAME} (
             id INTEGER PRIMARY KEY NOT NULL,
             building_id INTEGER NOT NULL,
-            json_string TEXT NOT NULL
+            timestamp INTEGER NOT NULL,
+            substitutions_count INTEGER NOT NULL DEFAULT 0,
+            size INTEGER NOT NULL DEFAULT 0,
+            uploaded_at INTEGER,
+            uploader_id INTEGER
             )
         """,
     )
 
-    def add_schedule(self, json_string: str) -> None:
+    _COLUMNS = {
+        "substitutions_count": "INTEGER",
+        "size": "INTEGER",
+        "uploaded_at": "INTEGER",
+        "uploader_id": "INTEGER",
+    }
+
+    _MIGRATIONS = (
+        pyquoks.utils.format_multiline_string(
+            f"""
+                DELETE FROM {_NAME} WHERE id NOT IN (
+                SELECT MAX(id) FROM {_NAME} GROUP BY building_id, timestamp
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE UNIQUE INDEX IF NOT EXISTS {_NAME}_building_id_timestamp ON {_NAME} (building_id, timestamp)
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE TABLE IF NOT EXISTS {_ITEMS_NAME} (
+                id INTEGER PRIMARY KEY NOT NULL,
+                building_id INTEGER NOT NULL,
+                timestamp INTEGER NOT NULL,
+                group_name TEXT NOT NULL,
+                json_string TEXT NOT NULL
+                )
+            """,
+        ),
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE INDEX IF NOT EXISTS {_ITEMS_NAME}_building_id_timestamp_group_name ON {_ITEMS_NAME} (building_id, timestamp, group_name)
+            """,
+        ),
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._indexes: utils.LRUCache[tuple[int, int], models.SubstitutionsIndex] = utils.LRUCache(
+            max_size=constants.SUBSTITUTIONS_INDEXES_CACHE_SIZE,
+        )
+
+        self._migrate_json_strings()
+        self._migrate_metadata()
+
+        self._versions: dict[tuple[int, int], int] = {}
+
+    def get_version(self, building_id: int, timestamp: int) -> int:
+        return self._versions.get((building_id, timestamp), 0)
+
+    def _migrate_json_strings(self) -> None:
+        if "json_string" not in self._get_columns_set():
+            return
+
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    INSERT INTO {self._NAME} (
-                    building_id,
-                    json_string
-                    )
-                    VALUES (?, ?)
+                    SELECT building_id, timestamp, json_string FROM {self._NAME}
                 """,
             ),
-            (
-                constants.TEMP_BUILDING_ID,
-                json_string,
+        )
+
+        for result in cursor.fetchall():
+            self._replace_items(
+                building_id=result["building_id"],
+                timestamp=result["timestamp"],
+                json_string=result["json_string"],
+            )
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    ALTER TABLE {self._NAME} DROP COLUMN json_string
+                """,
             ),
         )
 
         self.commit()
 
-    def get_schedule(self) -> models.DatabaseSchedule | None:
+    def _migrate_metadata(self) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    SELECT * FROM {self._NAME} WHERE building_id = ?
+                    SELECT building_id, timestamp FROM {self._NAME} WHERE substitutions_count IS NULL OR size IS NULL
+                """,
+            ),
+        )
+
+        for result in cursor.fetchall():
+            self._update_counters(
+                building_id=result["building_id"],
+                timestamp=result["timestamp"],
+            )
+
+        self.commit()
+
+    def _update_counters(self, building_id: int, timestamp: int) -> None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    UPDATE {self._NAME} SET (substitutions_count, size) = (
+                    SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(json_string AS BLOB))), 0) FROM {self._ITEMS_NAME}
+                    WHERE building_id = ? AND timestamp = ?
+                    )
+                    WHERE building_id = ? AND timestamp = ?
                 """,
             ),
             (
-                constants.TEMP_BUILDING_ID,
+                building_id,
+                timestamp,
+                building_id,
+                timestamp,
             ),
         )
-        result = cursor.fetchone()
-
-        if result:
-            return models.DatabaseSchedule.model_validate(dict(result))
-        else:
-            return None
 
-    def edit_json_string(self, json_string: str) -> None:
+    def _update_uploader(self, building_id: int, timestamp: int, uploader_id: int) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    UPDATE {self._NAME} SET json_string = ? WHERE building_id = ?
+                    UPDATE {self._NAME} SET uploaded_at = ?, uploader_id = ? WHERE building_id = ? AND timestamp = ?
                 """,
             ),
             (
-                json_string,
-                constants.TEMP_BUILDING_ID,
+                int(time.time()),
+                uploader_id,
+                building_id,
+                timestamp,
             ),
         )
 
-        self.commit()
+    @staticmethod
+    def _get_index(substitutions_list: list[schedule_parser.models.Substitution]) -> models.SubstitutionsIndex:
+        groups_dict = collections.defaultdict(list)
+        teachers_dict = collections.defaultdict(set)
+        rooms_dict = collections.defaultdict(lambda: collections.defaultdict(set))
+
+        for substitution in substitutions_list:
+            groups_dict[substitution.group_name].append(substitution)
+            group_rooms = rooms_dict[substitution.number][substitution.group_name]
+
+            if substitution.room:
+                group_rooms.add(substitution.room)
+
+            if substitution.teacher:
+                teachers_dict[substitution.teacher].add(substitution.group_name)
+
+        return models.SubstitutionsIndex(
+            groups_dict=groups_dict,
+            teachers_dict=teachers_dict,
+            rooms_dict=rooms_dict,
+        )
+
+    def _delete_items(self, building_id: int, timestamp: int) -> None:
+        self._indexes.pop((building_id, timestamp))
 
-    def delete_schedule(self) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    DELETE FROM {self._NAME} WHERE building_id = ?
+                    DELETE FROM {self._ITEMS_NAME} WHERE building_id = ? AND timestamp = ?
                 """,
             ),
             (
-                constants.TEMP_BUILDING_ID,
+                building_id,
+                timestamp,
             ),
         )
 
-        self.commit()
+    def _replace_items(self, building_id: int, timestamp: int, json_string: str) -> None:
+        self._delete_items(
+            building_id=building_id,
+            timestamp=timestamp,
+        )
 
+        cursor = self.cursor()
 
-class SubstitutionsDatabase(pyquoks.managers.database.Database):
-    _NAME = "substitutions"
+        substitutions_list = [
+            schedule_parser.models.Substitution.model_validate(
+                substitution,
+            ) for substitution in json.loads(json_string)
+        ]
 
-    _SQL = pyquoks.utils.format_multiline_string(
-        f"""
-            CREATE TABLE IF NOT EXISTS {_NAME} (
-            id INTEGER PRIMARY KEY NOT NULL,
-            building_id INTEGER NOT NULL,
-            timestamp INTEGER NOT NULL,
-            json_string TEXT NOT NULL
-            )
-        """,
-    )
+        cursor.executemany(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    INSERT INTO {self._ITEMS_NAME} (
+                    building_id,
+                    timestamp,
+                    group_name,
+                    json_string
+                    )
+                    VALUES (?, ?, ?, ?)
+                """,
+            ),
+            [
+                (
+                    building_id,
+                    timestamp,
+                    substitution.group_name,
+                    substitution.model_dump_json(),
+                ) for substitution in substitutions_list
+            ],
+        )
+
+        self._indexes.set((building_id, timestamp), self._get_index(substitutions_list))
+
+    def _invalidate_cache(self, building_id: int, timestamp: int) -> None:
+        self._versions[(building_id, timestamp)] = self.get_version(building_id, timestamp) + 1
 
-    def add_substitution(self, timestamp: int, json_string: str) -> None:
+    @_threaded
+    def add_substitution(self, building_id: int, timestamp: int, json_string: str, uploader_id: int) -> None:
         cursor = self.cursor()
 
         cursor.execute(
@@ -121,22 +1518,38 @@ class SubstitutionsDatabase(pyquoks.managers.database.Database):
                 f"""
                     INSERT INTO {self._NAME} (
                     building_id,
-                    timestamp,
-                    json_string
+                    timestamp
                     )
-                    VALUES (?, ?, ?)
+                    VALUES (?, ?)
                 """,
             ),
             (
-                constants.TEMP_BUILDING_ID,
+                building_id,
                 timestamp,
-                json_string,
             ),
         )
 
+        self._replace_items(
+            building_id=building_id,
+            timestamp=timestamp,
+            json_string=json_string,
+        )
+        self._update_counters(
+            building_id=building_id,
+            timestamp=timestamp,
+        )
+        self._update_uploader(
+            building_id=building_id,
+            timestamp=timestamp,
+            uploader_id=uploader_id,
+        )
+
         self.commit()
 
-    def get_substitution(self, timestamp: int) -> models.DatabaseSubstitution | None:
+        self._invalidate_cache(building_id, timestamp)
+
+    @_threaded
+    def get_substitution(self, building_id: int, timestamp: int) -> models.DatabaseSubstitution | None:
         cursor = self.cursor()
 
         cursor.execute(
@@ -146,7 +1559,7 @@ class SubstitutionsDatabase(pyquoks.managers.database.Database):
                 """,
             ),
             (
-                constants.TEMP_BUILDING_ID,
+                building_id,
                 timestamp,
             ),
         )
@@ -157,25 +1570,83 @@ class SubstitutionsDatabase(pyquoks.managers.database.Database):
         else:
             return None
 
-    def edit_json_string(self, timestamp: int, json_string: str) -> None:
+    @_threaded
+    def get_substitutions_list(self, building_id: int, timestamp: int, group_name: str) -> list[schedule_parser.models.Substitution]:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT json_string FROM {self._ITEMS_NAME} WHERE building_id = ? AND timestamp = ? AND group_name = ? ORDER BY id
+                """,
+            ),
+            (
+                building_id,
+                timestamp,
+                group_name,
+            ),
+        )
+
+        return [
+            schedule_parser.models.Substitution.model_validate_json(
+                result["json_string"],
+            ) for result in cursor.fetchall()
+        ]
+
+    @_threaded
+    def get_substitutions_index(self, building_id: int, timestamp: int) -> models.SubstitutionsIndex:
+        if cached_index := self._indexes.get((building_id, timestamp)):
+            return cached_index
+
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    UPDATE {self._NAME} SET json_string = ? WHERE building_id = ? AND timestamp = ?
+                    SELECT json_string FROM {self._ITEMS_NAME} WHERE building_id = ? AND timestamp = ? ORDER BY id
                 """,
             ),
             (
-                json_string,
-                constants.TEMP_BUILDING_ID,
+                building_id,
                 timestamp,
             ),
         )
 
+        index = self._get_index(
+            [
+                schedule_parser.models.Substitution.model_validate_json(
+                    result["json_string"],
+                ) for result in cursor.fetchall()
+            ],
+        )
+
+        self._indexes.set((building_id, timestamp), index)
+
+        return index
+
+    @_threaded
+    def edit_json_string(self, building_id: int, timestamp: int, json_string: str, uploader_id: int) -> None:
+        self._replace_items(
+            building_id=building_id,
+            timestamp=timestamp,
+            json_string=json_string,
+        )
+        self._update_counters(
+            building_id=building_id,
+            timestamp=timestamp,
+        )
+        self._update_uploader(
+            building_id=building_id,
+            timestamp=timestamp,
+            uploader_id=uploader_id,
+        )
+
         self.commit()
 
-    def delete_substitution(self, timestamp: int) -> None:
+        self._invalidate_cache(building_id, timestamp)
+
+    @_threaded
+    def delete_substitution(self, building_id: int, timestamp: int) -> None:
         cursor = self.cursor()
 
         cursor.execute(
@@ -185,28 +1656,91 @@ class SubstitutionsDatabase(pyquoks.managers.database.Database):
                 """,
             ),
             (
-                constants.TEMP_BUILDING_ID,
+                building_id,
                 timestamp,
             ),
         )
 
+        self._delete_items(
+            building_id=building_id,
+            timestamp=timestamp,
+        )
+
         self.commit()
 
+        self._invalidate_cache(building_id, timestamp)
 
-class UsersDatabase(pyquoks.managers.database.Database):
+
+class UsersDatabase(Database):
     _NAME = "users"
 
     _SQL = pyquoks.utils.format_multiline_string(
         f"""
             CREATE TABLE IF NOT EXISTS {_NAME} (
             id INTEGER PRIMARY KEY NOT NULL,
+            building_id INTEGER NOT NULL,
             group_name TEXT NOT NULL,
             is_notifiable BOOLEAN NOT NULL
             )
         """,
     )
 
-    def add_user(self, _id: int, group_name: str, is_notifiable: bool) -> None:
+    _COLUMNS = {
+        "building_id": f"INTEGER NOT NULL DEFAULT {constants.DEFAULT_BUILDING_ID}",
+    }
+
+    _MIGRATIONS = (
+        pyquoks.utils.format_multiline_string(
+            f"""
+                CREATE INDEX IF NOT EXISTS {_NAME}_building_id_group_name ON {_NAME} (building_id, group_name)
+            """,
+        ),
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._cache: utils.LRUCache[int, models.DatabaseUser] = utils.LRUCache(
+            max_size=constants.USERS_CACHE_SIZE,
+        )
+
+    @property
+    def cache_info(self) -> models.CacheInfo:
+        return self._cache.cache_info
+
+    def _select_user(self, _id: int) -> models.DatabaseUser | None:
+        cursor = self.cursor()
+
+        cursor.execute(
+            pyquoks.utils.format_multiline_string(
+                f"""
+                    SELECT * FROM {self._NAME} WHERE id = ?
+                """,
+            ),
+            (
+                _id,
+            ),
+        )
+        result = cursor.fetchone()
+
+        if result:
+            return models.DatabaseUser.model_validate(dict(result))
+        else:
+            return None
+
+    def _update_cached_user(self, _id: int, **values) -> None:
+        if cached_user := self._cache.get(_id):
+            self._cache.set(_id, cached_user.model_copy(update=values))
+
+    @_threaded
+    def _fetch_user(self, _id: int) -> models.DatabaseUser | None:
+        return self._select_user(_id)
+
+    @_threaded
+    def _insert_user(self, _id: int, building_id: int, group_name: str, is_notifiable: bool) -> models.DatabaseUser:
+        if user := self._select_user(_id):
+            return user
+
         cursor = self.cursor()
 
         cursor.execute(
@@ -214,14 +1748,16 @@ class UsersDatabase(pyquoks.managers.database.Database):
                 f"""
                     INSERT OR IGNORE INTO {self._NAME} (
                     id,
+                    building_id,
                     group_name,
                     is_notifiable
                     )
-                    VALUES (?, ?, ?)
+                    VALUES (?, ?, ?, ?)
                 """,
             ),
             (
                 _id,
+                building_id,
                 group_name,
                 is_notifiable,
             ),
@@ -229,75 +1765,141 @@ class UsersDatabase(pyquoks.managers.database.Database):
 
         self.commit()
 
-    def get_user(self, _id: int) -> models.DatabaseUser | None:
+        return models.DatabaseUser(
+            id=_id,
+            building_id=building_id,
+            group_name=group_name,
+            is_notifiable=is_notifiable,
+        )
+
+    @_threaded
+    def _update_group_name(self, _id: int, building_id: int, group_name: str) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    SELECT * FROM {self._NAME} WHERE id = ?
+                    UPDATE {self._NAME} SET building_id = ?, group_name = ? WHERE id = ?
                 """,
             ),
             (
+                building_id,
+                group_name,
                 _id,
             ),
         )
-        result = cursor.fetchone()
 
-        if result:
-            return models.DatabaseUser.model_validate(dict(result))
-        else:
-            return None
+        self.commit()
 
-    def get_users_list(self) -> list[models.DatabaseUser]:
+    @_threaded
+    def _update_is_notifiable(self, _id: int, is_notifiable: bool) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    SELECT * FROM {self._NAME}
+                    UPDATE {self._NAME} SET is_notifiable = ? WHERE id = ?
                 """,
             ),
+            (
+                is_notifiable,
+                _id,
+            ),
         )
-        results = cursor.fetchall()
 
-        return [models.DatabaseUser.model_validate(dict(result)) for result in results]
+        self.commit()
+
+    async def add_user(self, _id: int, building_id: int, group_name: str, is_notifiable: bool) -> None:
+        if _id in self._cache:
+            return
+
+        self._cache.set(
+            _id,
+            await self._insert_user(
+                _id=_id,
+                building_id=building_id,
+                group_name=group_name,
+                is_notifiable=is_notifiable,
+            ),
+        )
+
+    async def get_user(self, _id: int) -> models.DatabaseUser | None:
+        if cached_user := self._cache.get(_id):
+            return cached_user
+
+        if user := await self._fetch_user(_id):
+            self._cache.set(_id, user)
 
-    def edit_group_name(self, _id: int, group_name: str) -> None:
+        return user
+
+    @_threaded
+    def get_users_list(self) -> list[models.DatabaseUser]:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    UPDATE {self._NAME} SET group_name = ? WHERE id = ?
+                    SELECT * FROM {self._NAME}
                 """,
             ),
-            (
-                group_name,
-                _id,
-            ),
         )
+        results = cursor.fetchall()
 
-        self.commit()
+        return [models.DatabaseUser.model_validate(dict(result)) for result in results]
+
+    @_threaded
+    def get_group_users_list(
+            self,
+            building_id: int,
+            group_names: typing.Collection[str],
+            is_notifiable: bool,
+    ) -> list[models.DatabaseUser]:
+        if not group_names:
+            return []
 
-    def edit_is_notifiable(self, _id: int, is_notifiable: bool) -> None:
         cursor = self.cursor()
 
         cursor.execute(
             pyquoks.utils.format_multiline_string(
                 f"""
-                    UPDATE {self._NAME} SET is_notifiable = ? WHERE id = ?
+                    SELECT * FROM {self._NAME} WHERE building_id = ? AND group_name IN ({", ".join("?" * len(group_names))}) AND is_notifiable = ?
                 """,
             ),
             (
+                building_id,
+                *group_names,
                 is_notifiable,
-                _id,
             ),
         )
+        results = cursor.fetchall()
 
-        self.commit()
+        return [models.DatabaseUser.model_validate(dict(result)) for result in results]
+
+    async def edit_group_name(self, _id: int, building_id: int, group_name: str) -> None:
+        await self._update_group_name(
+            _id=_id,
+            building_id=building_id,
+            group_name=group_name,
+        )
+
+        self._update_cached_user(
+            _id,
+            building_id=building_id,
+            group_name=group_name,
+        )
+
+    async def edit_is_notifiable(self, _id: int, is_notifiable: bool) -> None:
+        await self._update_is_notifiable(
+            _id=_id,
+            is_notifiable=is_notifiable,
+        )
+
+        self._update_cached_user(
+            _id,
+            is_notifiable=is_notifiable,
+        )
 
-    def _edit_setting(self, _id: int, setting: str, value: bool) -> None:
+    async def _edit_setting(self, _id: int, setting: str, value: bool) -> None:
         edit_callable = getattr(self, f"edit_{setting}", None)
 
         if not edit_callable:
@@ -306,4 +1908,4 @@ class UsersDatabase(pyquoks.managers.database.Database):
                 obj=self,
             )
 
-        return edit_callable(_id, value)
+        return await edit_callable(_id, value)
@@ -1,54 +1,197 @@
+import enum
+import functools
 import json
+import time
+import typing
 
+import aiogram
 import pydantic
 import schedule_parser.models
 
+from . import constants
+from . import serializers
+
+
+# region Enums
+
+class BroadcastState(enum.StrEnum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    BLOCKED = "blocked"
+
+
+class RunMode(enum.StrEnum):
+    POLLING = "polling"
+    WEBHOOK = "webhook"
+
+
+# endregion
 
 # region Models
 
+class BroadcastMessage(pydantic.BaseModel):
+    chat_id: int
+    text: str
+    reply_markup: aiogram.types.InlineKeyboardMarkup | None = None
+
+
+class BroadcastProgress(pydantic.BaseModel):
+    sent: int
+    failed: int
+    blocked: int
+    remaining: int
+
+
+class CacheInfo(pydantic.BaseModel):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    evictions: int
+
+
+class DatabaseBroadcastMessage(pydantic.BaseModel):
+    id: int
+    job_id: str
+    chat_id: int
+    text: str
+    reply_markup_json_string: str | None
+    state: BroadcastState
+
+    @property
+    def reply_markup(self) -> aiogram.types.InlineKeyboardMarkup | None:
+        if self.reply_markup_json_string:
+            return aiogram.types.InlineKeyboardMarkup.model_validate_json(self.reply_markup_json_string)
+        else:
+            return None
+
+
 class DatabaseSchedule(pydantic.BaseModel):
     id: int
     building_id: int
-    json_string: str
+    data: bytes
+    groups_count: int
+    size: int
+    uploaded_at: int | None
+    uploader_id: int | None
+
+    _packed_groups: serializers.PackedSegments = pydantic.PrivateAttr()
+
+    def model_post_init(self, context: typing.Any) -> None:
+        self._packed_groups = serializers.PackedSegments(self.data)
+
+    @property
+    def packed_groups(self) -> serializers.PackedSegments:
+        return self._packed_groups
 
     @property
-    def groups_list(self) -> list[schedule_parser.models.GroupSchedule]:
+    def group_names_list(self) -> list[str]:
+        return self.packed_groups.names_list
+
+    @property
+    def json_string(self) -> str:
+        return self.packed_groups.to_json_string()
+
+    def has_group(self, group_name: str) -> bool:
+        return group_name in self.packed_groups
+
+    @staticmethod
+    def pack_groups_list(groups_list: list[schedule_parser.models.GroupSchedule]) -> bytes:
+        return serializers.pack_segments(
+            {
+                group_schedule.group_name: group_schedule.model_dump() for group_schedule in groups_list
+            },
+        )
+
+    @staticmethod
+    def unpack_groups_list(data: bytes) -> list[schedule_parser.models.GroupSchedule]:
+        packed_groups = serializers.PackedSegments(data)
+
         return [
             schedule_parser.models.GroupSchedule.model_validate(
-                group_schedule,
-            ) for group_schedule in json.loads(self.json_string)
+                packed_groups.get(group_name),
+            ) for group_name in packed_groups.names_list
         ]
 
-    def get_group_schedule_by_group_name(self, group_name: str) -> schedule_parser.models.GroupSchedule:
-        return schedule_parser.models.GroupSchedule.get_group_schedule_by_group_name(
-            iterable=self.groups_list,
-            group_name=group_name,
+    @staticmethod
+    def get_days_dict(group_schedule: schedule_parser.models.GroupSchedule) -> dict[int, schedule_parser.models.DaySchedule]:
+        return {
+            day_schedule.weekday: day_schedule for day_schedule in group_schedule.days_list
+        }
+
+    @classmethod
+    def get_diff(cls, previous_data: bytes, data: bytes) -> ScheduleDiff:
+        previous_packed_groups = serializers.PackedSegments(previous_data)
+        packed_groups = serializers.PackedSegments(data)
+
+        weekdays_dict = {}
+
+        for group_name in packed_groups.names_list:
+            if group_name not in previous_packed_groups:
+                continue
+
+            previous_group_schedule = previous_packed_groups.get(group_name)
+            group_schedule = packed_groups.get(group_name)
+
+            if previous_group_schedule == group_schedule:
+                continue
+
+            previous_days_dict = cls.get_days_dict(
+                schedule_parser.models.GroupSchedule.model_validate(previous_group_schedule),
+            )
+            days_dict = cls.get_days_dict(
+                schedule_parser.models.GroupSchedule.model_validate(group_schedule),
+            )
+
+            weekdays_dict[group_name] = [
+                weekday for weekday in sorted(previous_days_dict.keys() | days_dict.keys())
+                if previous_days_dict.get(weekday) != days_dict.get(weekday)
+            ]
+
+        return ScheduleDiff(
+            added_group_names={
+                group_name for group_name in packed_groups.names_list if group_name not in previous_packed_groups
+            },
+            removed_group_names={
+                group_name for group_name in previous_packed_groups.names_list if group_name not in packed_groups
+            },
+            weekdays_dict=weekdays_dict,
         )
 
 
+class DatabaseState(pydantic.BaseModel):
+    key: str
+    state: str | None
+    data_json_string: str
+    expires_at: int
+
+    @functools.cached_property
+    def data(self) -> dict:
+        return json.loads(self.data_json_string)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.state is None and not self.data
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at <= time.time()
+
+
 class DatabaseSubstitution(pydantic.BaseModel):
     id: int
     building_id: int
     timestamp: int
-    json_string: str
-
-    @property
-    def substitutions_list(self) -> list[schedule_parser.models.Substitution]:
-        return [
-            schedule_parser.models.Substitution.model_validate(
-                substitution,
-            ) for substitution in json.loads(self.json_string)
-        ]
-
-    def get_substitutions_by_group_name(self, group_name: str) -> list[schedule_parser.models.Substitution]:
-        return schedule_parser.models.Substitution.get_substitutions_by_group_name(
-            iterable=self.substitutions_list,
-            group_name=group_name,
-        )
+    substitutions_count: int
+    size: int
+    uploaded_at: int | None
+    uploader_id: int | None
 
 
 class DatabaseUser(pydantic.BaseModel):
     id: int
+    building_id: int
     group_name: str
     is_notifiable: bool
 
@@ -59,6 +202,7 @@ class DatabaseUser(pydantic.BaseModel):
     @staticmethod
     def _default_values() -> dict:
         return {
+            "building_id": constants.DEFAULT_BUILDING_ID,
             "group_name": "",
             "is_notifiable": True,
         }
@@ -69,4 +213,25 @@ class DatabaseUser(pydantic.BaseModel):
             "is_notifiable",
         }
 
+
+class ScheduleDiff(pydantic.BaseModel):
+    added_group_names: set[str]
+    removed_group_names: set[str]
+    weekdays_dict: dict[str, list[int]]
+
+    @property
+    def group_names(self) -> set[str]:
+        return self.added_group_names | self.removed_group_names | self.weekdays_dict.keys()
+
+
+class SubstitutionsIndex(pydantic.BaseModel):
+    groups_dict: dict[str, list[schedule_parser.models.Substitution]]
+    teachers_dict: dict[str, set[str]]
+    rooms_dict: dict[int, dict[str, set[str]]]
+
+
+class TeacherPeriod(pydantic.BaseModel):
+    group_name: str
+    period: schedule_parser.models.Period
+
 # endregion
@@ -35,14 +35,45 @@ class ButtonsProvider:
     def view_groups(self) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.view_groups(),
-            callback_data=f"view_groups {constants.FIRST_PAGE}",
+            callback_data="view_buildings view_groups",
+        )
+
+    def view_teachers(self) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.view_teachers(),
+            callback_data="view_buildings view_teachers",
         )
 
     @staticmethod
-    def group(group_name: str) -> aiogram.types.InlineKeyboardButton:
+    def building(callback_data: str, building_id: int, building_name: str) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=building_name,
+            callback_data=f"{callback_data} {building_id} {constants.FIRST_PAGE}",
+        )
+
+    @staticmethod
+    def group(building_id: int, group_name: str) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=group_name,
-            callback_data=f"group {group_name}",
+            callback_data=f"group {building_id} {group_name}",
+        )
+
+    @staticmethod
+    def teacher(building_id: int, teacher_name: str) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=teacher_name,
+            callback_data=f"teacher {building_id} {utils.get_teacher_id(teacher_name)}",
+        )
+
+    @staticmethod
+    def teacher_schedule(
+            building_id: int,
+            teacher_id: str,
+            date: datetime.datetime,
+    ) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=utils.get_readable_date(date),
+            callback_data=f"teacher_schedule {building_id} {teacher_id} {utils.get_timestamp_from_date(date)}",
         )
 
     def settings(self) -> aiogram.types.InlineKeyboardButton:
@@ -86,47 +117,84 @@ class ButtonsProvider:
 
     # region /admin
 
-    def manage_schedule(self) -> aiogram.types.InlineKeyboardButton:
+    @staticmethod
+    def manage_building(building_id: int, building_name: str) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=building_name,
+            callback_data=f"manage_building {building_id}",
+        )
+
+    def manage_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.schedule(),
-            callback_data="manage_schedule",
+            callback_data=f"manage_schedule {building_id}",
         )
 
-    def upload_schedule(self) -> aiogram.types.InlineKeyboardButton:
+    def upload_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.upload(),
-            callback_data="upload_schedule",
+            callback_data=f"upload_schedule {building_id}",
         )
 
-    def delete_schedule(self) -> aiogram.types.InlineKeyboardButton:
+    def delete_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.delete(),
-            callback_data="delete_schedule",
+            callback_data=f"delete_schedule {building_id}",
         )
 
-    def view_substitutions(self) -> aiogram.types.InlineKeyboardButton:
+    def export_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.export(),
+            callback_data=f"export_schedule {building_id}",
+        )
+
+    def view_substitutions(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.substitutions(),
-            callback_data="view_substitutions",
+            callback_data=f"view_substitutions {building_id}",
         )
 
     @staticmethod
-    def manage_substitutions(date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+    def manage_substitutions(building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=utils.get_readable_date(date),
-            callback_data=f"manage_substitutions {utils.get_timestamp_from_date(date)}",
+            callback_data=f"manage_substitutions {building_id} {utils.get_timestamp_from_date(date)}",
         )
 
-    def upload_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+    def upload_substitutions(self, building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.upload(),
-            callback_data=f"upload_substitutions {utils.get_timestamp_from_date(date)}",
+            callback_data=f"upload_substitutions {building_id} {utils.get_timestamp_from_date(date)}",
         )
 
-    def delete_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+    def delete_substitutions(self, building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.delete(),
-            callback_data=f"delete_substitutions {utils.get_timestamp_from_date(date)}",
+            callback_data=f"delete_substitutions {building_id} {utils.get_timestamp_from_date(date)}",
+        )
+
+    def view_free_rooms(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.free_rooms(),
+            callback_data=f"view_free_rooms {building_id}",
+        )
+
+    @staticmethod
+    def free_rooms_periods(building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=utils.get_readable_date(date),
+            callback_data=f"free_rooms {building_id} {utils.get_timestamp_from_date(date)}",
+        )
+
+    def free_rooms(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+            number: int,
+    ) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.period(number),
+            callback_data=f"free_rooms {building_id} {utils.get_timestamp_from_date(date)} {number}",
         )
 
     def export_logs(self) -> aiogram.types.InlineKeyboardButton:
@@ -135,6 +203,12 @@ class ButtonsProvider:
             callback_data="export_logs",
         )
 
+    def logs_period(self, hours: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.logs_period(hours),
+            callback_data=f"export_logs {hours}",
+        )
+
     # endregion
 
     # region back_to_*
@@ -157,34 +231,82 @@ class ButtonsProvider:
             callback_data="admin",
         )
 
-    def back_to_manage_schedule(self) -> aiogram.types.InlineKeyboardButton:
+    def back_to_view_buildings(self, callback_data: str) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"view_buildings {callback_data}",
+        )
+
+    def back_to_view_teachers(self, building_id: int, current_page: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.back(),
-            callback_data="manage_schedule",
+            callback_data=f"view_teachers {building_id} {current_page}",
         )
 
-    def back_to_view_substitutions(self) -> aiogram.types.InlineKeyboardButton:
+    def back_to_teacher(self, building_id: int, teacher_id: str) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.back(),
-            callback_data="view_substitutions",
+            callback_data=f"teacher {building_id} {teacher_id}",
         )
 
-    def back_to_manage_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+    def back_to_manage_building(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.back(),
-            callback_data=f"manage_substitutions {utils.get_timestamp_from_date(date)}",
+            callback_data=f"manage_building {building_id}",
         )
 
-    def cancel_to_manage_schedule(self) -> aiogram.types.InlineKeyboardButton:
+    def back_to_manage_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"manage_schedule {building_id}",
+        )
+
+    def back_to_view_substitutions(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"view_substitutions {building_id}",
+        )
+
+    def back_to_manage_substitutions(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+    ) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"manage_substitutions {building_id} {utils.get_timestamp_from_date(date)}",
+        )
+
+    def back_to_view_free_rooms(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"view_free_rooms {building_id}",
+        )
+
+    def back_to_free_rooms_periods(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+    ) -> aiogram.types.InlineKeyboardButton:
+        return aiogram.types.InlineKeyboardButton(
+            text=self._strings.button.back(),
+            callback_data=f"free_rooms {building_id} {utils.get_timestamp_from_date(date)}",
+        )
+
+    def cancel_to_manage_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.cancel(),
-            callback_data="manage_schedule",
+            callback_data=f"manage_schedule {building_id}",
         )
 
-    def cancel_to_manage_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardButton:
+    def cancel_to_manage_substitutions(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+    ) -> aiogram.types.InlineKeyboardButton:
         return aiogram.types.InlineKeyboardButton(
             text=self._strings.button.cancel(),
-            callback_data=f"manage_substitutions {utils.get_timestamp_from_date(date)}",
+            callback_data=f"manage_substitutions {building_id} {utils.get_timestamp_from_date(date)}",
         )
 
     # endregion
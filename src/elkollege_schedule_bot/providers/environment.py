@@ -3,3 +3,4 @@ import pyquoks.providers.environment
 
 class EnvironmentProvider(pyquoks.providers.environment.EnvironmentProvider):
     TELEGRAM_BOT_TOKEN: str
+    TELEGRAM_WEBHOOK_SECRET: str | None
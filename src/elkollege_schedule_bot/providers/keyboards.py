@@ -1,10 +1,8 @@
 import datetime
-import itertools
 import math
 
 import aiogram
 import aiogram.utils.keyboard
-import schedule_parser.models
 
 from . import buttons
 from .. import constants
@@ -61,6 +59,9 @@ class KeyboardsProvider:
             self._buttons.view_groups(),
             self._buttons.settings(),
         )
+        markup_builder.row(
+            self._buttons.view_teachers(),
+        )
 
         return markup_builder.as_markup()
 
@@ -91,35 +92,132 @@ class KeyboardsProvider:
 
         return markup_builder.as_markup()
 
+    def view_buildings(self, callback_data: str, buildings_dict: dict[int, str]) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.building(
+                    callback_data=callback_data,
+                    building_id=building_id,
+                    building_name=building_name,
+                ) for building_id, building_name in buildings_dict.items()
+            ],
+            width=constants.BUILDINGS_PER_ROW,
+        )
+        markup_builder.row(
+            self._buttons.back_to_start(),
+        )
+
+        return markup_builder.as_markup()
+
     def view_groups(
             self,
-            groups: list[schedule_parser.models.GroupSchedule],
+            building_id: int,
+            group_names: tuple[str, ...],
             current_page: int,
+            has_buildings: bool,
     ) -> aiogram.types.InlineKeyboardMarkup:
-        buttons_index = current_page - 1
+        buttons_index = (current_page - 1) * constants.GROUPS_PER_PAGE
 
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
             *[
-                self._buttons.group(group.group_name) for group in list(
-                    itertools.batched(
-                        groups,
-                        constants.GROUPS_PER_PAGE,
-                    )
-                )[buttons_index]
+                self._buttons.group(
+                    building_id=building_id,
+                    group_name=group_name,
+                ) for group_name in group_names[
+                    buttons_index:buttons_index + constants.GROUPS_PER_PAGE
+                ]
             ],
             width=constants.GROUPS_PER_ROW,
         )
         markup_builder.row(
             *self._get_page_buttons(
-                callback_data="view_groups",
+                callback_data=f"view_groups {building_id}",
                 current_page=current_page,
-                items_count=len(groups),
+                items_count=len(group_names),
                 items_per_page=constants.GROUPS_PER_PAGE,
             ),
         )
         markup_builder.row(
-            self._buttons.back_to_start(),
+            self._buttons.back_to_view_buildings(
+                callback_data="view_groups",
+            ) if has_buildings else self._buttons.back_to_start(),
+        )
+
+        return markup_builder.as_markup()
+
+    def view_teachers(
+            self,
+            building_id: int,
+            teacher_names: tuple[str, ...],
+            current_page: int,
+            has_buildings: bool,
+    ) -> aiogram.types.InlineKeyboardMarkup:
+        buttons_index = (current_page - 1) * constants.TEACHERS_PER_PAGE
+
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.teacher(
+                    building_id=building_id,
+                    teacher_name=teacher_name,
+                ) for teacher_name in teacher_names[buttons_index:buttons_index + constants.TEACHERS_PER_PAGE]
+            ],
+            width=constants.TEACHERS_PER_ROW,
+        )
+        markup_builder.row(
+            *self._get_page_buttons(
+                callback_data=f"view_teachers {building_id}",
+                current_page=current_page,
+                items_count=len(teacher_names),
+                items_per_page=constants.TEACHERS_PER_PAGE,
+            ),
+        )
+        markup_builder.row(
+            self._buttons.back_to_view_buildings(
+                callback_data="view_teachers",
+            ) if has_buildings else self._buttons.back_to_start(),
+        )
+
+        return markup_builder.as_markup()
+
+    def view_teacher_schedules(
+            self,
+            building_id: int,
+            teacher_id: str,
+            current_page: int,
+    ) -> aiogram.types.InlineKeyboardMarkup:
+        current_date = datetime.datetime.now()
+
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.teacher_schedule(
+                    building_id=building_id,
+                    teacher_id=teacher_id,
+                    date=current_date + datetime.timedelta(
+                        days=days_delta,
+                    ),
+                ) for days_delta in range(constants.SCHEDULE_DAYS)
+            ],
+        )
+        markup_builder.row(
+            self._buttons.back_to_view_teachers(
+                building_id=building_id,
+                current_page=current_page,
+            ),
+        )
+
+        return markup_builder.as_markup()
+
+    def teacher_schedule(self, building_id: int, teacher_id: str) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            self._buttons.back_to_teacher(
+                building_id=building_id,
+                teacher_id=teacher_id,
+            ),
         )
 
         return markup_builder.as_markup()
@@ -168,11 +266,16 @@ class KeyboardsProvider:
 
     # region /admin
 
-    def admin(self) -> aiogram.types.InlineKeyboardMarkup:
+    def admin(self, buildings_dict: dict[int, str]) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.manage_schedule(),
-            self._buttons.view_substitutions(),
+            *[
+                self._buttons.manage_building(
+                    building_id=building_id,
+                    building_name=building_name,
+                ) for building_id, building_name in buildings_dict.items()
+            ],
+            width=constants.BUILDINGS_PER_ROW,
         )
         markup_builder.row(
             self._buttons.export_logs(),
@@ -180,11 +283,77 @@ class KeyboardsProvider:
 
         return markup_builder.as_markup()
 
-    def manage_schedule(self) -> aiogram.types.InlineKeyboardMarkup:
+    def manage_building(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            self._buttons.manage_schedule(building_id),
+            self._buttons.view_substitutions(building_id),
+        )
+        markup_builder.row(
+            self._buttons.view_free_rooms(building_id),
+        )
+        markup_builder.row(
+            self._buttons.back_to_admin(),
+        )
+
+        return markup_builder.as_markup()
+
+    def view_free_rooms(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
+        current_date = datetime.datetime.now()
+
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.free_rooms_periods(
+                    building_id,
+                    current_date + datetime.timedelta(
+                        days=days_delta,
+                    ),
+                ) for days_delta in range(constants.SCHEDULE_DAYS)
+            ],
+        )
+        markup_builder.row(
+            self._buttons.back_to_manage_building(building_id),
+        )
+
+        return markup_builder.as_markup()
+
+    def free_rooms_periods(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+            period_numbers: tuple[int, ...],
+    ) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.free_rooms(building_id, date, number) for number in period_numbers
+            ],
+            width=constants.PERIODS_PER_ROW,
+        )
+        markup_builder.row(
+            self._buttons.back_to_view_free_rooms(building_id),
+        )
+
+        return markup_builder.as_markup()
+
+    def free_rooms(self, building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.upload_schedule(),
-            self._buttons.delete_schedule(),
+            self._buttons.back_to_free_rooms_periods(building_id, date),
+        )
+
+        return markup_builder.as_markup()
+
+    def export_logs(self) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            *[
+                self._buttons.logs_period(
+                    hours=hours,
+                ) for hours in constants.LOGGING_EXPORT_PERIODS
+            ],
+            width=constants.LOGGING_PERIODS_PER_ROW,
         )
         markup_builder.row(
             self._buttons.back_to_admin(),
@@ -192,29 +361,45 @@ class KeyboardsProvider:
 
         return markup_builder.as_markup()
 
-    def upload_schedule(self) -> aiogram.types.InlineKeyboardMarkup:
+    def manage_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.cancel_to_manage_schedule(),
+            self._buttons.upload_schedule(building_id),
+            self._buttons.delete_schedule(building_id),
+        )
+        markup_builder.row(
+            self._buttons.export_schedule(building_id),
+        )
+        markup_builder.row(
+            self._buttons.back_to_manage_building(building_id),
         )
 
         return markup_builder.as_markup()
 
-    def upload_schedule_completed(self) -> aiogram.types.InlineKeyboardMarkup:
+    def upload_schedule(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.back_to_manage_schedule(),
+            self._buttons.cancel_to_manage_schedule(building_id),
         )
 
         return markup_builder.as_markup()
 
-    def view_substitutions(self) -> aiogram.types.InlineKeyboardMarkup:
+    def upload_schedule_completed(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
+        markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
+        markup_builder.row(
+            self._buttons.back_to_manage_schedule(building_id),
+        )
+
+        return markup_builder.as_markup()
+
+    def view_substitutions(self, building_id: int) -> aiogram.types.InlineKeyboardMarkup:
         current_date = datetime.datetime.now()
 
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
             *[
                 self._buttons.manage_substitutions(
+                    building_id,
                     current_date + datetime.timedelta(
                         days=days_delta,
                     ),
@@ -222,35 +407,39 @@ class KeyboardsProvider:
             ],
         )
         markup_builder.row(
-            self._buttons.back_to_admin(),
+            self._buttons.back_to_manage_building(building_id),
         )
 
         return markup_builder.as_markup()
 
-    def manage_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
+    def manage_substitutions(self, building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.upload_substitutions(date),
-            self._buttons.delete_substitutions(date),
+            self._buttons.upload_substitutions(building_id, date),
+            self._buttons.delete_substitutions(building_id, date),
         )
         markup_builder.row(
-            self._buttons.back_to_view_substitutions(),
+            self._buttons.back_to_view_substitutions(building_id),
         )
 
         return markup_builder.as_markup()
 
-    def upload_substitutions(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
+    def upload_substitutions(self, building_id: int, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.cancel_to_manage_substitutions(date),
+            self._buttons.cancel_to_manage_substitutions(building_id, date),
         )
 
         return markup_builder.as_markup()
 
-    def upload_substitutions_completed(self, date: datetime.datetime) -> aiogram.types.InlineKeyboardMarkup:
+    def upload_substitutions_completed(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+    ) -> aiogram.types.InlineKeyboardMarkup:
         markup_builder = aiogram.utils.keyboard.InlineKeyboardBuilder()
         markup_builder.row(
-            self._buttons.back_to_manage_substitutions(date),
+            self._buttons.back_to_manage_substitutions(building_id, date),
         )
 
         return markup_builder.as_markup()
@@ -1,4 +1,5 @@
 import datetime
+import html
 
 import aiogram
 import pyquoks.providers.strings
@@ -61,12 +62,20 @@ class AlertStrings(pyquoks.providers.strings.Strings):
     def logging_disabled(cls) -> str:
         return "Логирование отключено!"
 
+    @classmethod
+    def logs_too_large(cls) -> str:
+        return "Логи за этот период слишком большие!"
+
     # endregion
 
     @classmethod
     def button_unavailable(cls) -> str:
         return "Эта кнопка недоступна!"
 
+    @classmethod
+    def menu_outdated(cls) -> str:
+        return "Это меню устарело, откройте его заново!"
+
 
 class ButtonStrings(pyquoks.providers.strings.Strings):
 
@@ -80,6 +89,10 @@ class ButtonStrings(pyquoks.providers.strings.Strings):
     def view_groups(cls) -> str:
         return "Выбрать группу"
 
+    @classmethod
+    def view_teachers(cls) -> str:
+        return "Преподаватели"
+
     @classmethod
     def settings(cls) -> str:
         return "Настройки"
@@ -124,10 +137,30 @@ class ButtonStrings(pyquoks.providers.strings.Strings):
     def substitutions(cls) -> str:
         return "Замены"
 
+    @classmethod
+    def export(cls) -> str:
+        return "Экспортировать"
+
+    @classmethod
+    def free_rooms(cls) -> str:
+        return "Свободные аудитории"
+
+    @classmethod
+    def period(cls, number: int) -> str:
+        return f"{number} пара"
+
     @classmethod
     def export_logs(cls) -> str:
         return "Экспортировать логи"
 
+    @classmethod
+    def logs_period(cls, hours: int) -> str:
+        match hours:
+            case 0:
+                return "За всё время"
+            case _:
+                return f"За {hours} ч."
+
     # endregion
 
     # region back_to_*
@@ -174,7 +207,7 @@ class MenuStrings(pyquoks.providers.strings.Strings):
                 Электростальского колледжа
                 для вашей учебной группы.
             """,
-            user.full_name,
+            html.escape(user.full_name),
         )
 
     @classmethod
@@ -202,11 +235,22 @@ class MenuStrings(pyquoks.providers.strings.Strings):
             """,
             utils.get_readable_date(date),
             "\n\n".join(i for i in [
-                "\n".join(period.readable for period in schedule) if schedule else "ℹ️ Пары отсутствуют",
+                "\n".join(html.escape(period.readable) for period in schedule) if schedule else "ℹ️ Пары отсутствуют",
                 "ℹ️ Замены не загружены" if not has_substitutions else None,
             ] if i),
         )
 
+    @classmethod
+    def view_buildings(cls) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Выбор корпуса</b>
+                
+                Выберите учебный корпус
+                из списка ниже:
+            """,
+        )
+
     @classmethod
     def view_groups(cls) -> str:
         return pyquoks.utils.format_multiline_string(
@@ -218,6 +262,54 @@ class MenuStrings(pyquoks.providers.strings.Strings):
             """,
         )
 
+    @classmethod
+    def view_teachers(cls) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Выбор преподавателя</b>
+                
+                Выберите преподавателя
+                из списка ниже:
+            """,
+        )
+
+    @classmethod
+    def view_teacher_schedules(cls, teacher_name: str) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>{0}</b>
+                
+                Выберите нужную дату:
+            """,
+            html.escape(teacher_name),
+        )
+
+    @classmethod
+    def teacher_schedule(
+            cls,
+            teacher_name: str,
+            date: datetime.datetime,
+            teacher_periods: list[models.TeacherPeriod],
+            has_substitutions: bool,
+    ) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>{0}</b>
+                <b>Расписание на {1}</b>
+                
+                {2}
+            """,
+            html.escape(teacher_name),
+            utils.get_readable_date(date),
+            "\n\n".join(i for i in [
+                "\n".join(
+                    f"<b>{html.escape(teacher_period.group_name)}</b>: {html.escape(teacher_period.period.readable)}"
+                    for teacher_period in teacher_periods
+                ) if teacher_periods else "ℹ️ Пары отсутствуют",
+                "ℹ️ Замены не загружены" if not has_substitutions else None,
+            ] if i),
+        )
+
     @classmethod
     def settings(cls, user: models.DatabaseUser) -> str:
         return pyquoks.utils.format_multiline_string(
@@ -228,7 +320,7 @@ class MenuStrings(pyquoks.providers.strings.Strings):
             """,
             "\n".join(i for i in [
                 f"User ID: <b>{user.id}</b>",
-                f"Группа: <b>{user.group_name}</b>" if user.has_group else None,
+                f"Группа: <b>{html.escape(user.group_name)}</b>" if user.has_group else None,
             ] if i),
         )
 
@@ -255,7 +347,14 @@ class MenuStrings(pyquoks.providers.strings.Strings):
     # region /admin
 
     @classmethod
-    def admin(cls, user: aiogram.types.User, date_started: datetime.datetime) -> str:
+    def admin(
+            cls,
+            user: aiogram.types.User,
+            date_started: datetime.datetime,
+            schedule_cache_info: models.CacheInfo,
+            users_cache_info: models.CacheInfo,
+            broadcast_progress: models.BroadcastProgress,
+    ) -> str:
         return pyquoks.utils.format_multiline_string(
             """
                 <b>Меню администратора</b>
@@ -263,9 +362,28 @@ class MenuStrings(pyquoks.providers.strings.Strings):
                 Добро пожаловать, {0}!
                 
                 Дата запуска: <b>{1} UTC</b>
+                
+                Кэш расписания: {2}
+                Кэш пользователей: {3}
+                
+                Рассылка: {4}
             """,
-            user.full_name,
+            html.escape(user.full_name),
             date_started.astimezone(datetime.UTC).strftime(constants.DATE_FORMAT_STARTED),
+            cls._cache_info(schedule_cache_info),
+            cls._cache_info(users_cache_info),
+            cls._broadcast_progress(broadcast_progress),
+        )
+
+    @classmethod
+    def manage_building(cls, building_name: str) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>{0}</b>
+                
+                Выберите нужный раздел:
+            """,
+            html.escape(building_name),
         )
 
     @classmethod
@@ -278,7 +396,8 @@ class MenuStrings(pyquoks.providers.strings.Strings):
             """,
             "\n".join(i for i in [
                 f"Статус расписания: <b>{"Загружено" if schedule else "Отсутствует"}</b>",
-                f"Учебных групп: <b>{len(schedule.groups_list)}</b>" if schedule else None,
+                f"Учебных групп: <b>{schedule.groups_count}</b>" if schedule else None,
+                cls._upload_info(schedule.size, schedule.uploaded_at, schedule.uploader_id) if schedule else None,
             ] if i),
         )
 
@@ -304,14 +423,22 @@ class MenuStrings(pyquoks.providers.strings.Strings):
         )
 
     @classmethod
-    def upload_schedule_success(cls, schedule: models.DatabaseSchedule) -> str:
+    def upload_schedule_success(
+            cls,
+            schedule: models.DatabaseSchedule,
+            schedule_diff: models.ScheduleDiff | None,
+    ) -> str:
         return pyquoks.utils.format_multiline_string(
             """
                 <b>Расписание загружено!</b>
                 
-                Учебных групп: <b>{0}</b>
+                {0}
             """,
-            len(schedule.groups_list),
+            "\n".join(i for i in [
+                f"Учебных групп: <b>{schedule.groups_count}</b>",
+                f"Изменено групп: <b>{len(schedule_diff.group_names)}</b>" if schedule_diff else None,
+                f"Размер: <b>{cls._size(schedule.size)}</b>",
+            ] if i),
         )
 
     @classmethod
@@ -339,7 +466,8 @@ class MenuStrings(pyquoks.providers.strings.Strings):
             utils.get_readable_date(date),
             "\n".join(i for i in [
                 f"Статус замен: <b>{"Загружены" if substitution else "Отсутствуют"}</b>",
-                f"Замен: <b>{len(substitution.substitutions_list)}</b>" if substitution else None,
+                f"Замен: <b>{substitution.substitutions_count}</b>" if substitution else None,
+                cls._upload_info(substitution.size, substitution.uploaded_at, substitution.uploader_id) if substitution else None,
             ] if i),
         )
 
@@ -376,9 +504,64 @@ class MenuStrings(pyquoks.providers.strings.Strings):
                 <b>Замены на {0} загружены!</b>
                 
                 Замен: <b>{1}</b>
+                Размер: <b>{2}</b>
+            """,
+            utils.get_readable_date(date),
+            substitution.substitutions_count,
+            cls._size(substitution.size),
+        )
+
+    @classmethod
+    def view_free_rooms(cls) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Свободные аудитории</b>
+                
+                Выберите нужную дату:
+            """,
+        )
+
+    @classmethod
+    def free_rooms_periods(cls, date: datetime.datetime) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Свободные аудитории на {0}</b>
+                
+                Выберите номер пары:
             """,
             utils.get_readable_date(date),
-            len(substitution.substitutions_list),
+        )
+
+    @classmethod
+    def free_rooms(
+            cls,
+            date: datetime.datetime,
+            number: int,
+            rooms: tuple[str, ...],
+            has_substitutions: bool,
+    ) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Свободные аудитории на {0}, {1} пара</b>
+                
+                {2}
+            """,
+            utils.get_readable_date(date),
+            number,
+            "\n\n".join(i for i in [
+                html.escape(", ".join(rooms)) if rooms else "ℹ️ Свободные аудитории отсутствуют",
+                "ℹ️ Замены не загружены" if not has_substitutions else None,
+            ] if i),
+        )
+
+    @classmethod
+    def export_logs(cls) -> str:
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Экспорт логов</b>
+                
+                Выберите период:
+            """,
         )
 
     # endregion
@@ -394,16 +577,94 @@ class MenuStrings(pyquoks.providers.strings.Strings):
         )
 
     @classmethod
-    def notification_substitutions_uploaded(cls, date: datetime.datetime) -> str:
+    def notification_schedule_changed(cls, group_name: str, schedule_diff: models.ScheduleDiff) -> str:
+        if group_name in schedule_diff.added_group_names:
+            changes_string = "Группа добавлена в расписание"
+        elif group_name in schedule_diff.removed_group_names:
+            changes_string = "Группа отсутствует в новом расписании"
+        elif weekdays_list := schedule_diff.weekdays_dict[group_name]:
+            changes_string = f"Изменения: <b>{", ".join(cls._weekday(weekday) for weekday in weekdays_list)}</b>"
+        else:
+            changes_string = "Изменения в описании группы"
+
+        return pyquoks.utils.format_multiline_string(
+            """
+                <b>Расписание группы {0} обновлено!</b>
+                
+                {1}
+            """,
+            html.escape(group_name),
+            changes_string,
+        )
+
+    @classmethod
+    def notification_substitutions_uploaded(
+            cls,
+            date: datetime.datetime,
+            substitutions: list[schedule_parser.models.Substitution],
+    ) -> str:
         return pyquoks.utils.format_multiline_string(
             """
                 <b>Загружены замены на {0}!</b>
+                
+                {1}
             """,
             utils.get_readable_date(date),
+            "\n".join(cls._substitution(substitution) for substitution in substitutions),
         )
 
     # endregion
 
+    @classmethod
+    def _broadcast_progress(cls, broadcast_progress: models.BroadcastProgress) -> str:
+        return " / ".join([
+            f"отправлено: <b>{broadcast_progress.sent}</b>",
+            f"ошибок: <b>{broadcast_progress.failed}</b>",
+            f"заблокировали: <b>{broadcast_progress.blocked}</b>",
+            f"осталось: <b>{broadcast_progress.remaining}</b>",
+        ])
+
+    @classmethod
+    def _cache_info(cls, cache_info: models.CacheInfo) -> str:
+        return " / ".join([
+            f"<b>{cache_info.size}</b> из <b>{cache_info.max_size}</b>",
+            f"попаданий: <b>{cache_info.hits}</b>",
+            f"промахов: <b>{cache_info.misses}</b>",
+            f"вытеснений: <b>{cache_info.evictions}</b>",
+        ])
+
+    @classmethod
+    def _size(cls, size: int) -> str:
+        return f"{size / 1024:.1f} КБ"
+
+    @classmethod
+    def _substitution(cls, substitution: schedule_parser.models.Substitution) -> str:
+        return f"{substitution.number}. {" / ".join(html.escape(i) for i in [
+            substitution.subject,
+            substitution.teacher,
+            substitution.room,
+        ] if i) or "Пара отменена"}"
+
+    @classmethod
+    def _upload_info(cls, size: int, uploaded_at: int | None, uploader_id: int | None) -> str:
+        return "\n".join(i for i in [
+            f"Размер: <b>{cls._size(size)}</b>",
+            f"Загружено: <b>{utils.get_date_from_timestamp(uploaded_at).strftime(constants.DATE_FORMAT_STARTED)}</b>" if uploaded_at else None,
+            f"Загрузил: <code>{uploader_id}</code>" if uploader_id else None,
+        ] if i)
+
+    @classmethod
+    def _weekday(cls, weekday: int) -> str:
+        return (
+            "понедельник",
+            "вторник",
+            "среда",
+            "четверг",
+            "пятница",
+            "суббота",
+            "воскресенье",
+        )[weekday]
+
 
 class SettingsStrings(pyquoks.providers.strings.Strings):
     @classmethod
@@ -1,3 +1,6 @@
+import asyncio
+import os
+import time
 import typing
 
 import aiogram
@@ -13,7 +16,10 @@ from ..managers import config
 from ..managers import database
 from ..providers import keyboards
 from ..providers import strings
+from ..services import broadcast
 from ..services import logger
+from ..services import metrics
+from ..services import parser
 
 
 class CallbacksRouter(aiogram.Router):
@@ -24,6 +30,9 @@ class CallbacksRouter(aiogram.Router):
             keyboards_provider: keyboards.KeyboardsProvider,
             strings_provider: strings.StringsProvider,
             logger_service: logger.LoggerService,
+            broadcast_service: broadcast.BroadcastService,
+            parser_service: parser.ParserService,
+            metrics_service: metrics.MetricsService,
             aiogram_bot: aiogram.Bot,
     ) -> None:
         self._config = config_manager
@@ -31,8 +40,15 @@ class CallbacksRouter(aiogram.Router):
         self._keyboards = keyboards_provider
         self._strings = strings_provider
         self._logger = logger_service
+        self._broadcast = broadcast_service
+        self._parser = parser_service
+        self._metrics = metrics_service
         self._bot = aiogram_bot
 
+        self._schedule_messages: utils.LRUCache[tuple[int, str, int, int, int, int], str] = utils.LRUCache(
+            max_size=constants.SCHEDULE_MESSAGES_CACHE_SIZE,
+        )
+
         super().__init__(
             name=self.__class__.__name__,
         )
@@ -43,6 +59,79 @@ class CallbacksRouter(aiogram.Router):
 
         self._logger.info(f"{self.name} initialized!")
 
+    # region Helpers
+
+    async def _view_groups(
+            self,
+            call: aiogram.types.CallbackQuery,
+            building_id: int,
+            current_page: int,
+    ) -> typing.Any:
+        current_group_names = self._database.schedules.get_group_names(building_id)
+
+        if current_group_names is None:
+            return await self._bot.answer_callback_query(
+                callback_query_id=call.id,
+                text=self._strings.alert.schedule_missing(),
+                show_alert=True,
+            )
+
+        await self._bot.edit_message_text(
+            chat_id=call.message.chat.id,
+            message_id=call.message.message_id,
+            text=self._strings.menu.view_groups(),
+            reply_markup=self._keyboards.view_groups(
+                building_id=building_id,
+                group_names=current_group_names,
+                current_page=current_page,
+                has_buildings=len(self._config.settings.buildings_list) > 1,
+            ),
+        )
+
+    async def _view_teachers(
+            self,
+            call: aiogram.types.CallbackQuery,
+            building_id: int,
+            current_page: int,
+    ) -> typing.Any:
+        current_teacher_names = self._database.schedules.get_teacher_names(building_id)
+
+        if current_teacher_names is None:
+            return await self._bot.answer_callback_query(
+                callback_query_id=call.id,
+                text=self._strings.alert.schedule_missing(),
+                show_alert=True,
+            )
+
+        await self._bot.edit_message_text(
+            chat_id=call.message.chat.id,
+            message_id=call.message.message_id,
+            text=self._strings.menu.view_teachers(),
+            reply_markup=self._keyboards.view_teachers(
+                building_id=building_id,
+                teacher_names=current_teacher_names,
+                current_page=current_page,
+                has_buildings=len(self._config.settings.buildings_list) > 1,
+            ),
+        )
+
+    def _has_group(self, building_id: str, group_name: str) -> bool:
+        return (
+                building_id.isdigit() and
+                int(building_id) in utils.get_buildings_dict(self._config.settings.buildings_list) and
+                group_name in (self._database.schedules.get_group_names(int(building_id)) or ())
+        )
+
+    def _get_teacher_page(self, building_id: int, teacher_name: str) -> int:
+        current_teacher_names = self._database.schedules.get_teacher_names(building_id) or ()
+
+        if teacher_name in current_teacher_names:
+            return current_teacher_names.index(teacher_name) // constants.TEACHERS_PER_PAGE + constants.FIRST_PAGE
+        else:
+            return constants.FIRST_PAGE
+
+    # endregion
+
     # region Handlers
 
     async def _callback_handler(
@@ -50,25 +139,28 @@ class CallbacksRouter(aiogram.Router):
             call: aiogram.types.CallbackQuery,
             state: aiogram.fsm.context.FSMContext,
     ) -> typing.Any:
+        started = time.perf_counter()
+
         is_admin = call.from_user.id in self._config.settings.admins_list
+        current_route, *_ = call.data.split(constants.CALL_DATA_SEPARATOR)
 
         self._logger.log_user_interaction(
             user=call.from_user,
             interaction=f"{call.data} ({is_admin=})",
         )
 
-        await state.clear()
+        try:
+            await state.clear()
 
-        self._database.users.add_user(
-            _id=call.from_user.id,
-            **models.DatabaseUser._default_values(),
-        )
+            await self._database.users.add_user(
+                _id=call.from_user.id,
+                **models.DatabaseUser._default_values(),
+            )
 
-        current_database_user = self._database.users.get_user(
-            _id=call.from_user.id,
-        )
+            current_database_user = await self._database.users.get_user(
+                _id=call.from_user.id,
+            )
 
-        try:
             match call.data.split(constants.CALL_DATA_SEPARATOR):
                 case ["start"]:
                     await self._bot.edit_message_text(
@@ -80,7 +172,9 @@ class CallbacksRouter(aiogram.Router):
                         reply_markup=self._keyboards.start(),
                     )
                 case ["view_schedules"]:
-                    current_database_schedule = self._database.schedules.get_schedule()
+                    current_database_schedule = await self._database.schedules.get_schedule(
+                        building_id=current_database_user.building_id,
+                    )
 
                     if not current_database_schedule:
                         return await self._bot.answer_callback_query(
@@ -99,92 +193,118 @@ class CallbacksRouter(aiogram.Router):
                     current_timestamp = int(current_timestamp)
                     current_date = utils.get_date_from_timestamp(current_timestamp)
 
-                    current_database_schedule = self._database.schedules.get_schedule()
+                    current_schedule_message_key = (
+                        current_database_user.building_id,
+                        current_database_user.group_name,
+                        current_timestamp,
+                        self._database.schedules.get_version(current_database_user.building_id),
+                        self._database.schedules.get_group_version(
+                            current_database_user.building_id,
+                            current_database_user.group_name,
+                        ),
+                        self._database.substitutions.get_version(current_database_user.building_id, current_timestamp),
+                    )
 
-                    if not current_database_schedule:
-                        return await self._bot.answer_callback_query(
-                            callback_query_id=call.id,
-                            text=self._strings.alert.schedule_missing(),
-                            show_alert=True,
-                        )
+                    current_schedule_message = self._schedule_messages.get(current_schedule_message_key)
 
-                    if not current_database_user.has_group:
-                        return await self._bot.answer_callback_query(
-                            callback_query_id=call.id,
-                            text=self._strings.alert.group_not_selected(),
-                            show_alert=True,
+                    if not current_schedule_message:
+                        current_database_schedule = await self._database.schedules.get_schedule(
+                            building_id=current_database_user.building_id,
                         )
 
-                    try:
-                        current_group_schedule = current_database_schedule.get_group_schedule_by_group_name(
+                        if not current_database_schedule:
+                            return await self._bot.answer_callback_query(
+                                callback_query_id=call.id,
+                                text=self._strings.alert.schedule_missing(),
+                                show_alert=True,
+                            )
+
+                        if not current_database_user.has_group:
+                            return await self._bot.answer_callback_query(
+                                callback_query_id=call.id,
+                                text=self._strings.alert.group_not_selected(),
+                                show_alert=True,
+                            )
+
+                        if not current_database_schedule.has_group(current_database_user.group_name):
+                            return await self._bot.answer_callback_query(
+                                callback_query_id=call.id,
+                                text=self._strings.alert.group_missing_in_schedule(),
+                                show_alert=True,
+                            )
+
+                        current_day_schedule = await self._database.schedules.get_day_schedule(
+                            building_id=current_database_user.building_id,
                             group_name=current_database_user.group_name,
-                        )
-                    except StopIteration:
-                        return await self._bot.answer_callback_query(
-                            callback_query_id=call.id,
-                            text=self._strings.alert.group_missing_in_schedule(),
-                            show_alert=True,
-                        )
-
-                    current_database_substitution = self._database.substitutions.get_substitution(
-                        timestamp=current_timestamp,
-                    )
-
-                    try:
-                        current_day_schedule = current_group_schedule.get_day_schedule_by_weekday(
                             weekday=current_date.weekday(),
                         )
 
-                        current_periods_list = current_day_schedule.periods_list
-                    except StopIteration:
-                        current_periods_list = []
+                        if current_day_schedule:
+                            current_periods_list = current_day_schedule.periods_list
+                        else:
+                            current_periods_list = []
 
-                    if current_database_substitution:
-                        current_substitutions_list = current_database_substitution.get_substitutions_by_group_name(
+                        current_substitutions_list = await self._database.substitutions.get_substitutions_list(
+                            building_id=current_database_user.building_id,
+                            timestamp=current_timestamp,
                             group_name=current_database_user.group_name,
                         )
-                    else:
-                        current_substitutions_list = []
 
-                    await self._bot.edit_message_text(
-                        chat_id=call.message.chat.id,
-                        message_id=call.message.message_id,
-                        text=self._strings.menu.schedule(
+                        current_schedule_message = self._strings.menu.schedule(
                             date=current_date,
                             schedule=schedule_parser.utils.apply_substitutions_to_schedule(
                                 schedule=current_periods_list,
                                 substitutions=current_substitutions_list,
                             ),
                             has_substitutions=bool(current_substitutions_list),
-                        ),
-                        reply_markup=self._keyboards.schedule(),
-                    )
-                case ["view_groups", current_page]:
-                    current_page = int(current_page)
+                        )
 
-                    current_database_schedule = self._database.schedules.get_schedule()
+                        self._schedule_messages.set(current_schedule_message_key, current_schedule_message)
 
-                    if not current_database_schedule:
-                        return await self._bot.answer_callback_query(
-                            callback_query_id=call.id,
-                            text=self._strings.alert.schedule_missing(),
-                            show_alert=True,
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=current_schedule_message,
+                        reply_markup=self._keyboards.schedule(),
+                    )
+                case ["view_buildings", ("view_groups" | "view_teachers") as current_callback_data]:
+                    current_buildings_dict = utils.get_buildings_dict(self._config.settings.buildings_list)
+
+                    if len(current_buildings_dict) == 1:
+                        return await getattr(self, f"_{current_callback_data}")(
+                            call=call,
+                            building_id=next(iter(current_buildings_dict)),
+                            current_page=constants.FIRST_PAGE,
                         )
 
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
                         message_id=call.message.message_id,
-                        text=self._strings.menu.view_groups(),
-                        reply_markup=self._keyboards.view_groups(
-                            groups=current_database_schedule.groups_list,
-                            current_page=current_page,
+                        text=self._strings.menu.view_buildings(),
+                        reply_markup=self._keyboards.view_buildings(
+                            callback_data=current_callback_data,
+                            buildings_dict=current_buildings_dict,
                         ),
                     )
-                case ["group", *current_group_name]:
+                case ["view_groups", current_building_id, current_page]:
+                    await self._view_groups(
+                        call=call,
+                        building_id=int(current_building_id),
+                        current_page=int(current_page),
+                    )
+                case ["group", current_building_id, *current_group_name]:
                     current_group_name = constants.CALL_DATA_SEPARATOR.join(current_group_name)
 
-                    self._database.users.edit_group_name(
+                    if not self._has_group(current_building_id, current_group_name):
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.menu_outdated(),
+                            show_alert=True,
+                        )
+
+                    await self._database.users.edit_group_name(
                         _id=current_database_user.id,
+                        building_id=int(current_building_id),
                         group_name=current_group_name,
                     )
 
@@ -195,6 +315,83 @@ class CallbacksRouter(aiogram.Router):
                         ),
                         show_alert=True,
                     )
+                case ["view_teachers", current_building_id, current_page]:
+                    await self._view_teachers(
+                        call=call,
+                        building_id=int(current_building_id),
+                        current_page=int(current_page),
+                    )
+                case ["teacher", current_building_id, current_teacher_id]:
+                    current_building_id = int(current_building_id)
+
+                    current_teacher_name = self._database.schedules.get_teacher_name(
+                        building_id=current_building_id,
+                        teacher_id=current_teacher_id,
+                    )
+
+                    if current_teacher_name is None:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.menu_outdated(),
+                            show_alert=True,
+                        )
+
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.view_teacher_schedules(
+                            teacher_name=current_teacher_name,
+                        ),
+                        reply_markup=self._keyboards.view_teacher_schedules(
+                            building_id=current_building_id,
+                            teacher_id=current_teacher_id,
+                            current_page=self._get_teacher_page(current_building_id, current_teacher_name),
+                        ),
+                    )
+                case ["teacher_schedule", current_building_id, current_teacher_id, current_timestamp]:
+                    current_building_id = int(current_building_id)
+                    current_timestamp = int(current_timestamp)
+                    current_date = utils.get_date_from_timestamp(current_timestamp)
+
+                    current_teacher_name = self._database.schedules.get_teacher_name(
+                        building_id=current_building_id,
+                        teacher_id=current_teacher_id,
+                    )
+
+                    if current_teacher_name is None:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.menu_outdated(),
+                            show_alert=True,
+                        )
+
+                    current_substitutions_index = await self._database.substitutions.get_substitutions_index(
+                        building_id=current_building_id,
+                        timestamp=current_timestamp,
+                    )
+
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.teacher_schedule(
+                            teacher_name=current_teacher_name,
+                            date=current_date,
+                            teacher_periods=utils.get_teacher_periods_list(
+                                teacher_name=current_teacher_name,
+                                teacher_periods=self._database.schedules.get_teacher_periods(
+                                    building_id=current_building_id,
+                                    teacher_name=current_teacher_name,
+                                    weekday=current_date.weekday(),
+                                ),
+                                substitutions_index=current_substitutions_index,
+                            ),
+                            has_substitutions=bool(current_substitutions_index.groups_dict),
+                        ),
+                        reply_markup=self._keyboards.teacher_schedule(
+                            building_id=current_building_id,
+                            teacher_id=current_teacher_id,
+                        ),
+                    )
                 case ["settings"]:
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
@@ -207,12 +404,13 @@ class CallbacksRouter(aiogram.Router):
                         ),
                     )
                 case ["unselect_group"]:
-                    self._database.users.edit_group_name(
+                    await self._database.users.edit_group_name(
                         _id=current_database_user.id,
+                        building_id=current_database_user.building_id,
                         group_name="",
                     )
 
-                    current_database_user = self._database.users.get_user(
+                    current_database_user = await self._database.users.get_user(
                         _id=call.from_user.id,
                     )
 
@@ -233,13 +431,13 @@ class CallbacksRouter(aiogram.Router):
                         show_alert=True,
                     )
                 case ["switchable_setting", current_setting]:
-                    self._database.users._edit_setting(
+                    await self._database.users._edit_setting(
                         _id=current_database_user.id,
                         setting=current_setting,
                         value=not getattr(current_database_user, current_setting),
                     )
 
-                    current_database_user = self._database.users.get_user(
+                    current_database_user = await self._database.users.get_user(
                         _id=call.from_user.id,
                     )
 
@@ -260,11 +458,42 @@ class CallbacksRouter(aiogram.Router):
                         text=self._strings.menu.admin(
                             user=call.from_user,
                             date_started=pyquoks.utils.get_process_created_datetime(),
+                            schedule_cache_info=self._database.schedules.cache_info,
+                            users_cache_info=self._database.users.cache_info,
+                            broadcast_progress=self._broadcast.progress,
+                        ),
+                        reply_markup=self._keyboards.admin(
+                            buildings_dict=utils.get_buildings_dict(self._config.settings.buildings_list),
                         ),
-                        reply_markup=self._keyboards.admin(),
                     )
-                case ["manage_schedule"] if is_admin:
-                    current_database_schedule = self._database.schedules.get_schedule()
+                case ["manage_building", current_building_id] if is_admin:
+                    current_building_id = int(current_building_id)
+
+                    current_buildings_dict = utils.get_buildings_dict(self._config.settings.buildings_list)
+
+                    if current_building_id not in current_buildings_dict:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.button_unavailable(),
+                            show_alert=True,
+                        )
+
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.manage_building(
+                            building_name=current_buildings_dict[current_building_id],
+                        ),
+                        reply_markup=self._keyboards.manage_building(
+                            building_id=current_building_id,
+                        ),
+                    )
+                case ["manage_schedule", current_building_id] if is_admin:
+                    current_building_id = int(current_building_id)
+
+                    current_database_schedule = await self._database.schedules.get_schedule(
+                        building_id=current_building_id,
+                    )
 
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
@@ -272,21 +501,36 @@ class CallbacksRouter(aiogram.Router):
                         text=self._strings.menu.manage_schedule(
                             schedule=current_database_schedule,
                         ),
-                        reply_markup=self._keyboards.manage_schedule(),
+                        reply_markup=self._keyboards.manage_schedule(
+                            building_id=current_building_id,
+                        ),
                     )
-                case ["upload_schedule"] if is_admin:
+                case ["upload_schedule", current_building_id] if is_admin:
+                    current_building_id = int(current_building_id)
+
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
                         message_id=call.message.message_id,
                         text=self._strings.menu.upload_schedule(
                             workbook_extension=self._config.settings.workbook_extension,
                         ),
-                        reply_markup=self._keyboards.upload_schedule(),
+                        reply_markup=self._keyboards.upload_schedule(
+                            building_id=current_building_id,
+                        ),
                     )
 
                     await state.set_state(states.upload_schedule)
-                case ["delete_schedule"] if is_admin:
-                    current_database_schedule = self._database.schedules.get_schedule()
+                    await state.set_data(
+                        data={
+                            "current_building_id": current_building_id,
+                        },
+                    )
+                case ["delete_schedule", current_building_id] if is_admin:
+                    current_building_id = int(current_building_id)
+
+                    current_database_schedule = await self._database.schedules.get_schedule(
+                        building_id=current_building_id,
+                    )
 
                     if not current_database_schedule:
                         return await self._bot.answer_callback_query(
@@ -295,9 +539,13 @@ class CallbacksRouter(aiogram.Router):
                             show_alert=True,
                         )
 
-                    self._database.schedules.delete_schedule()
+                    await self._database.schedules.delete_schedule(
+                        building_id=current_building_id,
+                    )
 
-                    current_database_schedule = self._database.schedules.get_schedule()
+                    current_database_schedule = await self._database.schedules.get_schedule(
+                        building_id=current_building_id,
+                    )
 
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
@@ -305,7 +553,9 @@ class CallbacksRouter(aiogram.Router):
                         text=self._strings.menu.manage_schedule(
                             schedule=current_database_schedule,
                         ),
-                        reply_markup=self._keyboards.manage_schedule(),
+                        reply_markup=self._keyboards.manage_schedule(
+                            building_id=current_building_id,
+                        ),
                     )
 
                     await self._bot.answer_callback_query(
@@ -313,18 +563,42 @@ class CallbacksRouter(aiogram.Router):
                         text=self._strings.alert.schedule_deleted(),
                         show_alert=True,
                     )
-                case ["view_substitutions"] if is_admin:
+                case ["export_schedule", current_building_id] if is_admin:
+                    current_database_schedule = await self._database.schedules.get_schedule(
+                        building_id=int(current_building_id),
+                    )
+
+                    if not current_database_schedule:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.schedule_missing(),
+                            show_alert=True,
+                        )
+
+                    await self._bot.send_document(
+                        chat_id=call.message.chat.id,
+                        message_thread_id=utils.get_message_thread_id(call.message),
+                        document=aiogram.types.BufferedInputFile(
+                            file=current_database_schedule.json_string.encode(),
+                            filename=f"schedule_{current_building_id}.json",
+                        ),
+                    )
+                case ["view_substitutions", current_building_id] if is_admin:
                     await self._bot.edit_message_text(
                         chat_id=call.message.chat.id,
                         message_id=call.message.message_id,
                         text=self._strings.menu.view_substitutions(),
-                        reply_markup=self._keyboards.view_substitutions(),
+                        reply_markup=self._keyboards.view_substitutions(
+                            building_id=int(current_building_id),
+                        ),
                     )
-                case ["manage_substitutions", current_timestamp] if is_admin:
+                case ["manage_substitutions", current_building_id, current_timestamp] if is_admin:
+                    current_building_id = int(current_building_id)
                     current_timestamp = int(current_timestamp)
                     current_date = utils.get_date_from_timestamp(current_timestamp)
 
-                    current_database_substitution = self._database.substitutions.get_substitution(
+                    current_database_substitution = await self._database.substitutions.get_substitution(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                     )
 
@@ -336,10 +610,12 @@ class CallbacksRouter(aiogram.Router):
                             substitution=current_database_substitution,
                         ),
                         reply_markup=self._keyboards.manage_substitutions(
+                            building_id=current_building_id,
                             date=current_date,
                         ),
                     )
-                case ["upload_substitutions", current_timestamp] if is_admin:
+                case ["upload_substitutions", current_building_id, current_timestamp] if is_admin:
+                    current_building_id = int(current_building_id)
                     current_timestamp = int(current_timestamp)
                     current_date = utils.get_date_from_timestamp(current_timestamp)
 
@@ -351,6 +627,7 @@ class CallbacksRouter(aiogram.Router):
                             workbook_extension=self._config.settings.workbook_extension,
                         ),
                         reply_markup=self._keyboards.upload_substitutions(
+                            building_id=current_building_id,
                             date=current_date,
                         ),
                     )
@@ -358,14 +635,17 @@ class CallbacksRouter(aiogram.Router):
                     await state.set_state(states.upload_substitutions)
                     await state.set_data(
                         data={
+                            "current_building_id": current_building_id,
                             "current_timestamp": current_timestamp,
                         },
                     )
-                case ["delete_substitutions", current_timestamp] if is_admin:
+                case ["delete_substitutions", current_building_id, current_timestamp] if is_admin:
+                    current_building_id = int(current_building_id)
                     current_timestamp = int(current_timestamp)
                     current_date = utils.get_date_from_timestamp(current_timestamp)
 
-                    current_database_substitution = self._database.substitutions.get_substitution(
+                    current_database_substitution = await self._database.substitutions.get_substitution(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                     )
 
@@ -376,11 +656,13 @@ class CallbacksRouter(aiogram.Router):
                             show_alert=True,
                         )
 
-                    self._database.substitutions.delete_substitution(
+                    await self._database.substitutions.delete_substitution(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                     )
 
-                    current_database_substitution = self._database.substitutions.get_substitution(
+                    current_database_substitution = await self._database.substitutions.get_substitution(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                     )
 
@@ -392,6 +674,7 @@ class CallbacksRouter(aiogram.Router):
                             substitution=current_database_substitution,
                         ),
                         reply_markup=self._keyboards.manage_substitutions(
+                            building_id=current_building_id,
                             date=current_date,
                         ),
                     )
@@ -401,6 +684,70 @@ class CallbacksRouter(aiogram.Router):
                         text=self._strings.alert.substitutions_deleted(),
                         show_alert=True,
                     )
+                case ["view_free_rooms", current_building_id] if is_admin:
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.view_free_rooms(),
+                        reply_markup=self._keyboards.view_free_rooms(
+                            building_id=int(current_building_id),
+                        ),
+                    )
+                case ["free_rooms", current_building_id, current_timestamp] if is_admin:
+                    current_building_id = int(current_building_id)
+                    current_date = utils.get_date_from_timestamp(int(current_timestamp))
+
+                    current_period_numbers = self._database.schedules.get_period_numbers(current_building_id)
+
+                    if current_period_numbers is None:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.schedule_missing(),
+                            show_alert=True,
+                        )
+
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.free_rooms_periods(
+                            date=current_date,
+                        ),
+                        reply_markup=self._keyboards.free_rooms_periods(
+                            building_id=current_building_id,
+                            date=current_date,
+                            period_numbers=current_period_numbers,
+                        ),
+                    )
+                case ["free_rooms", current_building_id, current_timestamp, current_number] if is_admin:
+                    current_building_id = int(current_building_id)
+                    current_timestamp = int(current_timestamp)
+                    current_number = int(current_number)
+                    current_date = utils.get_date_from_timestamp(current_timestamp)
+
+                    current_substitutions_index = await self._database.substitutions.get_substitutions_index(
+                        building_id=current_building_id,
+                        timestamp=current_timestamp,
+                    )
+
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.free_rooms(
+                            date=current_date,
+                            number=current_number,
+                            rooms=self._database.schedules.get_free_rooms(
+                                building_id=current_building_id,
+                                weekday=current_date.weekday(),
+                                number=current_number,
+                                substitutions_index=current_substitutions_index,
+                            ),
+                            has_substitutions=bool(current_substitutions_index.groups_dict),
+                        ),
+                        reply_markup=self._keyboards.free_rooms(
+                            building_id=current_building_id,
+                            date=current_date,
+                        ),
+                    )
                 case ["export_logs"] if is_admin:
                     if not self._config.settings.file_logging:
                         return await self._bot.answer_callback_query(
@@ -409,18 +756,49 @@ class CallbacksRouter(aiogram.Router):
                             show_alert=True,
                         )
 
-                    with self._logger.file as file:
+                    await self._bot.edit_message_text(
+                        chat_id=call.message.chat.id,
+                        message_id=call.message.message_id,
+                        text=self._strings.menu.export_logs(),
+                        reply_markup=self._keyboards.export_logs(),
+                    )
+                case ["export_logs", hours] if is_admin:
+                    if not self._config.settings.file_logging:
+                        return await self._bot.answer_callback_query(
+                            callback_query_id=call.id,
+                            text=self._strings.alert.logging_disabled(),
+                            show_alert=True,
+                        )
+
+                    export_path = await asyncio.to_thread(
+                        self._logger.export_file,
+                        time.time() - int(hours) * 3600 if int(hours) else 0,
+                    )
+
+                    try:
+                        if os.path.getsize(export_path) > constants.DOCUMENT_MAX_SIZE:
+                            return await self._bot.answer_callback_query(
+                                callback_query_id=call.id,
+                                text=self._strings.alert.logs_too_large(),
+                                show_alert=True,
+                            )
+
                         await self._bot.send_document(
                             chat_id=call.message.chat.id,
                             message_thread_id=utils.get_message_thread_id(call.message),
-                            document=aiogram.types.BufferedInputFile(
-                                file=file.read(),
-                                filename=file.name,
+                            document=aiogram.types.FSInputFile(
+                                path=export_path,
+                                filename=self._logger.export_filename,
+                                chunk_size=constants.LOGGING_CHUNK_SIZE,
                             ),
                         )
+                    finally:
+                        os.remove(export_path)
                 case ["answer_callback"]:
                     pass
                 case _:
+                    current_route = "unknown"
+
                     await self._bot.answer_callback_query(
                         callback_query_id=call.id,
                         text=self._strings.alert.button_unavailable(),
@@ -430,8 +808,14 @@ class CallbacksRouter(aiogram.Router):
             if type(exception) not in constants.IGNORED_EXCEPTIONS:
                 self._logger.log_exception(exception)
         finally:
-            await self._bot.answer_callback_query(
-                callback_query_id=call.id,
-            )
+            try:
+                await self._bot.answer_callback_query(
+                    callback_query_id=call.id,
+                )
+            finally:
+                self._metrics.observe_callback(
+                    route=current_route,
+                    started=started,
+                )
 
     # endregion
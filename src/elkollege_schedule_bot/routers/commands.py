@@ -11,7 +11,10 @@ from ..managers import config
 from ..managers import database
 from ..providers import keyboards
 from ..providers import strings
+from ..services import broadcast
 from ..services import logger
+from ..services import metrics
+from ..services import parser
 
 
 class CommandsRouter(aiogram.Router):
@@ -22,6 +25,9 @@ class CommandsRouter(aiogram.Router):
             keyboards_provider: keyboards.KeyboardsProvider,
             strings_provider: strings.StringsProvider,
             logger_service: logger.LoggerService,
+            broadcast_service: broadcast.BroadcastService,
+            parser_service: parser.ParserService,
+            metrics_service: metrics.MetricsService,
             aiogram_bot: aiogram.Bot,
     ) -> None:
         self._config = config_manager
@@ -29,6 +35,9 @@ class CommandsRouter(aiogram.Router):
         self._keyboards = keyboards_provider
         self._strings = strings_provider
         self._logger = logger_service
+        self._broadcast = broadcast_service
+        self._parser = parser_service
+        self._metrics = metrics_service
         self._bot = aiogram_bot
 
         super().__init__(
@@ -64,7 +73,7 @@ class CommandsRouter(aiogram.Router):
             interaction=command.text,
         )
 
-        self._database.users.add_user(
+        await self._database.users.add_user(
             _id=message.from_user.id,
             **models.DatabaseUser._default_values(),
         )
@@ -119,8 +128,13 @@ class CommandsRouter(aiogram.Router):
             text=self._strings.menu.admin(
                 user=message.from_user,
                 date_started=pyquoks.utils.get_process_created_datetime(),
+                schedule_cache_info=self._database.schedules.cache_info,
+                users_cache_info=self._database.users.cache_info,
+                broadcast_progress=self._broadcast.progress,
+            ),
+            reply_markup=self._keyboards.admin(
+                buildings_dict=utils.get_buildings_dict(self._config.settings.buildings_list),
             ),
-            reply_markup=self._keyboards.admin(),
         )
 
     # endregion
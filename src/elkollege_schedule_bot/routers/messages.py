@@ -1,12 +1,10 @@
 import datetime
-import json
+import logging
 import typing
 
 import aiogram
 import aiogram.filters
 import aiogram.fsm.context
-import openpyxl
-import schedule_parser.utils
 
 from .. import constants
 from .. import models
@@ -16,7 +14,10 @@ from ..managers import config
 from ..managers import database
 from ..providers import keyboards
 from ..providers import strings
+from ..services import broadcast
 from ..services import logger
+from ..services import metrics
+from ..services import parser
 
 
 class MessagesRouter(aiogram.Router):
@@ -27,6 +28,9 @@ class MessagesRouter(aiogram.Router):
             keyboards_provider: keyboards.KeyboardsProvider,
             strings_provider: strings.StringsProvider,
             logger_service: logger.LoggerService,
+            broadcast_service: broadcast.BroadcastService,
+            parser_service: parser.ParserService,
+            metrics_service: metrics.MetricsService,
             aiogram_bot: aiogram.Bot,
     ) -> None:
         self._config = config_manager
@@ -34,6 +38,9 @@ class MessagesRouter(aiogram.Router):
         self._keyboards = keyboards_provider
         self._strings = strings_provider
         self._logger = logger_service
+        self._broadcast = broadcast_service
+        self._parser = parser_service
+        self._metrics = metrics_service
         self._bot = aiogram_bot
 
         super().__init__(
@@ -58,11 +65,23 @@ class MessagesRouter(aiogram.Router):
             user: models.DatabaseUser,
             /,
             *,
+            building_id: int = None,
             is_notifiable: bool = None,
             has_group: bool = None,
             is_admin: bool = None,
     ) -> bool:
-        self._logger.info(f"{self._users_filter.__name__} ({user=}, {is_notifiable=}, {has_group=}, {is_admin=})")
+        self._logger.log_event(
+            self._users_filter.__name__,
+            sampled=True,
+            user_id=user.id,
+            building_id=building_id,
+            is_notifiable=is_notifiable,
+            has_group=has_group,
+            is_admin=is_admin,
+        )
+
+        if (building_id is not None) and not (building_id == user.building_id):
+            return False
 
         if (is_notifiable is not None) and not (is_notifiable == user.is_notifiable):
             return False
@@ -83,27 +102,30 @@ class MessagesRouter(aiogram.Router):
     ) -> None:
         self._logger.info(self._send_notifications.__name__)
 
-        for user in users_list:
-            try:
-                await self._bot.send_message(
+        await self._broadcast.broadcast(
+            messages_list=[
+                models.BroadcastMessage(
                     chat_id=user.id,
                     text=text(user),
                     reply_markup=reply_markup(user),
-                )
-            except Exception as exception:
-                if type(exception) not in constants.IGNORED_EXCEPTIONS:
-                    self._logger.log_exception(exception)
+                ) for user in users_list
+            ],
+        )
 
-    async def _send_schedule_uploaded_notifications(self) -> None:
-        self._logger.info(self._send_schedule_uploaded_notifications.__name__)
+    async def _send_schedule_uploaded_notifications(self, building_id: int) -> None:
+        self._logger.log_event(
+            self._send_schedule_uploaded_notifications.__name__,
+            building_id=building_id,
+        )
 
-        current_users_list = self._database.users.get_users_list()
+        current_users_list = await self._database.users.get_users_list()
 
         await self._send_notifications(
             users_list=list(
                 filter(
                     lambda user: self._users_filter(
                         user,
+                        building_id=building_id,
                         is_notifiable=True,
                         is_admin=False,
                     ),
@@ -116,24 +138,71 @@ class MessagesRouter(aiogram.Router):
             ),
         )
 
-    async def _send_substitutions_uploaded_notifications(self, date: datetime.datetime) -> None:
-        self._logger.info(f"{self._send_substitutions_uploaded_notifications.__name__} ({date=})")
+    async def _send_schedule_changed_notifications(self, building_id: int, schedule_diff: models.ScheduleDiff) -> None:
+        self._logger.log_event(
+            self._send_schedule_changed_notifications.__name__,
+            building_id=building_id,
+            groups_count=len(schedule_diff.group_names),
+        )
 
-        current_users_list = self._database.users.get_users_list()
+        current_users_list = await self._database.users.get_group_users_list(
+            building_id=building_id,
+            group_names=schedule_diff.group_names,
+            is_notifiable=True,
+        )
 
         await self._send_notifications(
             users_list=list(
                 filter(
                     lambda user: self._users_filter(
                         user,
-                        is_notifiable=True,
-                        has_group=True,
                         is_admin=False,
                     ),
                     current_users_list,
                 )
             ),
-            text=lambda _: self._strings.menu.notification_substitutions_uploaded(date),
+            text=lambda user: self._strings.menu.notification_schedule_changed(
+                group_name=user.group_name,
+                schedule_diff=schedule_diff,
+            ),
+            reply_markup=lambda user: self._keyboards.notification_schedule_uploaded(
+                has_group=user.group_name not in schedule_diff.removed_group_names,
+            ),
+        )
+
+    async def _send_substitutions_uploaded_notifications(
+            self,
+            building_id: int,
+            date: datetime.datetime,
+            substitutions_index: models.SubstitutionsIndex,
+    ) -> None:
+        self._logger.log_event(
+            self._send_substitutions_uploaded_notifications.__name__,
+            building_id=building_id,
+            date=utils.get_readable_date(date),
+            groups_count=len(substitutions_index.groups_dict),
+        )
+
+        current_users_list = await self._database.users.get_group_users_list(
+            building_id=building_id,
+            group_names=substitutions_index.groups_dict.keys(),
+            is_notifiable=True,
+        )
+
+        await self._send_notifications(
+            users_list=list(
+                filter(
+                    lambda user: self._users_filter(
+                        user,
+                        is_admin=False,
+                    ),
+                    current_users_list,
+                )
+            ),
+            text=lambda user: self._strings.menu.notification_substitutions_uploaded(
+                date=date,
+                substitutions=substitutions_index.groups_dict[user.group_name],
+            ),
             reply_markup=lambda _: self._keyboards.notification_substitutions_uploaded(date),
         )
 
@@ -146,11 +215,12 @@ class MessagesRouter(aiogram.Router):
             message: aiogram.types.Message,
             state: aiogram.fsm.context.FSMContext,
     ) -> typing.Any:
+        current_building_id = (await state.get_data()).get("current_building_id", constants.DEFAULT_BUILDING_ID)
         has_file = bool(message.document)
 
         self._logger.log_user_interaction(
             user=message.from_user,
-            interaction=f"{self._upload_schedule_handler.__name__} ({has_file=})",
+            interaction=f"{self._upload_schedule_handler.__name__} ({has_file=}, {current_building_id=})",
         )
 
         if not has_file:
@@ -158,7 +228,9 @@ class MessagesRouter(aiogram.Router):
                 chat_id=message.chat.id,
                 message_thread_id=utils.get_message_thread_id(message),
                 text=self._strings.menu.upload_schedule_error(),
-                reply_markup=self._keyboards.upload_schedule_completed(),
+                reply_markup=self._keyboards.upload_schedule_completed(
+                    building_id=current_building_id,
+                ),
             )
 
         with await self._bot.download_file(
@@ -169,39 +241,66 @@ class MessagesRouter(aiogram.Router):
                 ).file_path
         ) as file:
             try:
-                workbook = openpyxl.load_workbook(file)
-
-                current_database_schedule = self._database.schedules.get_schedule()
-
-                parsed_schedule = schedule_parser.utils.parse_schedule(
-                    worksheet=workbook.worksheets[0],
+                current_database_schedule = await self._database.schedules.get_schedule(
+                    building_id=current_building_id,
                 )
 
-                parsed_schedule_json_string = json.dumps(
-                    [group_schedule.model_dump() for group_schedule in parsed_schedule]
+                parsed_schedule_data = await self._parser.parse_schedule(
+                    data=file.read(),
                 )
 
                 if current_database_schedule:
-                    self._database.schedules.edit_json_string(
-                        json_string=parsed_schedule_json_string,
+                    current_schedule_diff = await self._database.schedules.edit_data(
+                        building_id=current_building_id,
+                        data=parsed_schedule_data,
+                        uploader_id=message.from_user.id,
                     )
                 else:
-                    self._database.schedules.add_schedule(
-                        json_string=parsed_schedule_json_string,
+                    current_schedule_diff = None
+
+                    await self._database.schedules.add_schedule(
+                        building_id=current_building_id,
+                        data=parsed_schedule_data,
+                        uploader_id=message.from_user.id,
                     )
 
-                current_database_schedule = self._database.schedules.get_schedule()
+                current_skipped_periods_count = self._database.schedules.get_skipped_periods_count(
+                    building_id=current_building_id,
+                )
+
+                if current_skipped_periods_count:
+                    self._logger.log_event(
+                        self._upload_schedule_handler.__name__,
+                        level=logging.WARNING,
+                        building_id=current_building_id,
+                        skipped_periods=current_skipped_periods_count,
+                    )
+
+                current_database_schedule = await self._database.schedules.get_schedule(
+                    building_id=current_building_id,
+                )
 
                 await self._bot.send_message(
                     chat_id=message.chat.id,
                     message_thread_id=utils.get_message_thread_id(message),
                     text=self._strings.menu.upload_schedule_success(
                         schedule=current_database_schedule,
+                        schedule_diff=current_schedule_diff,
+                    ),
+                    reply_markup=self._keyboards.upload_schedule_completed(
+                        building_id=current_building_id,
                     ),
-                    reply_markup=self._keyboards.upload_schedule_completed(),
                 )
 
-                await self._send_schedule_uploaded_notifications()
+                if current_schedule_diff is not None:
+                    await self._send_schedule_changed_notifications(
+                        building_id=current_building_id,
+                        schedule_diff=current_schedule_diff,
+                    )
+                else:
+                    await self._send_schedule_uploaded_notifications(
+                        building_id=current_building_id,
+                    )
             except Exception as exception:
                 if type(exception) not in constants.IGNORED_EXCEPTIONS:
                     self._logger.log_exception(exception)
@@ -210,7 +309,9 @@ class MessagesRouter(aiogram.Router):
                     chat_id=message.chat.id,
                     message_thread_id=utils.get_message_thread_id(message),
                     text=self._strings.menu.upload_schedule_error(),
-                    reply_markup=self._keyboards.upload_schedule_completed(),
+                    reply_markup=self._keyboards.upload_schedule_completed(
+                        building_id=current_building_id,
+                    ),
                 )
             finally:
                 await state.clear()
@@ -220,13 +321,15 @@ class MessagesRouter(aiogram.Router):
             message: aiogram.types.Message,
             state: aiogram.fsm.context.FSMContext,
     ) -> typing.Any:
-        current_timestamp = (await state.get_data())["current_timestamp"]
+        current_state_data = await state.get_data()
+        current_building_id = current_state_data.get("current_building_id", constants.DEFAULT_BUILDING_ID)
+        current_timestamp = current_state_data["current_timestamp"]
         current_date = utils.get_date_from_timestamp(current_timestamp)
         has_file = bool(message.document)
 
         self._logger.log_user_interaction(
             user=message.from_user,
-            interaction=f"{self._upload_substitutions_handler.__name__} ({has_file=}, {current_timestamp=})",
+            interaction=f"{self._upload_substitutions_handler.__name__} ({has_file=}, {current_building_id=}, {current_timestamp=})",
         )
 
         if not has_file:
@@ -235,6 +338,7 @@ class MessagesRouter(aiogram.Router):
                 message_thread_id=utils.get_message_thread_id(message),
                 text=self._strings.menu.upload_substitutions_error(),
                 reply_markup=self._keyboards.upload_substitutions_completed(
+                    building_id=current_building_id,
                     date=current_date,
                 ),
             )
@@ -247,32 +351,32 @@ class MessagesRouter(aiogram.Router):
                 ).file_path
         ) as file:
             try:
-                workbook = openpyxl.load_workbook(file)
-
-                current_database_substitution = self._database.substitutions.get_substitution(
+                current_database_substitution = await self._database.substitutions.get_substitution(
+                    building_id=current_building_id,
                     timestamp=current_timestamp,
                 )
 
-                parsed_substitutions = schedule_parser.utils.parse_substitutions(
-                    worksheet=workbook.worksheets[0],
-                )
-
-                parsed_substitutions_json_string = json.dumps(
-                    [substitution.model_dump() for substitution in parsed_substitutions]
+                parsed_substitutions_json_string = await self._parser.parse_substitutions(
+                    data=file.read(),
                 )
 
                 if current_database_substitution:
-                    self._database.substitutions.edit_json_string(
+                    await self._database.substitutions.edit_json_string(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                         json_string=parsed_substitutions_json_string,
+                        uploader_id=message.from_user.id,
                     )
                 else:
-                    self._database.substitutions.add_substitution(
+                    await self._database.substitutions.add_substitution(
+                        building_id=current_building_id,
                         timestamp=current_timestamp,
                         json_string=parsed_substitutions_json_string,
+                        uploader_id=message.from_user.id,
                     )
 
-                current_database_substitution = self._database.substitutions.get_substitution(
+                current_database_substitution = await self._database.substitutions.get_substitution(
+                    building_id=current_building_id,
                     timestamp=current_timestamp,
                 )
 
@@ -284,12 +388,18 @@ class MessagesRouter(aiogram.Router):
                         substitution=current_database_substitution,
                     ),
                     reply_markup=self._keyboards.upload_substitutions_completed(
+                        building_id=current_building_id,
                         date=current_date,
                     ),
                 )
 
                 await self._send_substitutions_uploaded_notifications(
+                    building_id=current_building_id,
                     date=current_date,
+                    substitutions_index=await self._database.substitutions.get_substitutions_index(
+                        building_id=current_building_id,
+                        timestamp=current_timestamp,
+                    ),
                 )
             except Exception as exception:
                 if type(exception) not in constants.IGNORED_EXCEPTIONS:
@@ -300,6 +410,7 @@ class MessagesRouter(aiogram.Router):
                     message_thread_id=utils.get_message_thread_id(message),
                     text=self._strings.menu.upload_substitutions_error(),
                     reply_markup=self._keyboards.upload_substitutions_completed(
+                        building_id=current_building_id,
                         date=current_date,
                     ),
                 )
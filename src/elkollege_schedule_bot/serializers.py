@@ -0,0 +1,119 @@
+import collections
+import json
+import re
+import struct
+import typing
+import zlib
+
+_MAGIC = b"ESB1"
+_HEADER = struct.Struct("<4sII")
+_SEGMENT = struct.Struct("<HI")
+_STRING_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"')
+_ZDICT_MAX_SIZE = 32768
+
+
+def _dump_segment(value: typing.Any) -> bytes:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def _get_zdict(segments_list: list[bytes]) -> bytes:
+    strings_counter = collections.Counter()
+
+    for segment in segments_list:
+        strings_counter.update(_STRING_PATTERN.findall(segment))
+
+    return b"".join(
+        sorted(
+            (string for string, count in strings_counter.items() if count > 1),
+            key=lambda string: strings_counter[string] * len(string),
+        )
+    )[-_ZDICT_MAX_SIZE:]
+
+
+def pack_segments(segments_dict: dict[str, typing.Any]) -> bytes:
+    dumped_segments_dict = {
+        name: _dump_segment(value) for name, value in segments_dict.items()
+    }
+    zdict = _get_zdict(list(dumped_segments_dict.values()))
+
+    compressed_segments_dict = {}
+
+    for name, segment in dumped_segments_dict.items():
+        compressor = zlib.compressobj(
+            level=zlib.Z_BEST_COMPRESSION,
+            zdict=zdict,
+        )
+        compressed_segments_dict[name.encode()] = compressor.compress(segment) + compressor.flush()
+
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, len(zdict), len(compressed_segments_dict)),
+            zdict,
+            *(
+                _SEGMENT.pack(len(name), len(segment)) + name
+                for name, segment in compressed_segments_dict.items()
+            ),
+            *compressed_segments_dict.values(),
+        ]
+    )
+
+
+class PackedSegments:
+    def __init__(self, data: bytes) -> None:
+        magic, zdict_length, segments_count = _HEADER.unpack_from(data)
+
+        if magic != _MAGIC:
+            raise ValueError(f"Unknown format ({magic=})")
+
+        self._data = memoryview(data)
+
+        offset = _HEADER.size
+        self._zdict = bytes(self._data[offset:offset + zdict_length])
+        offset += zdict_length
+
+        segment_headers_list = []
+
+        for _ in range(segments_count):
+            name_length, segment_length = _SEGMENT.unpack_from(data, offset)
+            offset += _SEGMENT.size
+
+            segment_headers_list.append((bytes(self._data[offset:offset + name_length]).decode(), segment_length))
+            offset += name_length
+
+        self._segments: dict[str, tuple[int, int]] = {}
+
+        for name, segment_length in segment_headers_list:
+            self._segments[name] = (offset, segment_length)
+            offset += segment_length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._segments
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    @property
+    def names_list(self) -> list[str]:
+        return list(self._segments)
+
+    def get(self, name: str) -> typing.Any:
+        offset, segment_length = self._segments[name]
+
+        decompressor = zlib.decompressobj(
+            zdict=self._zdict,
+        )
+
+        return json.loads(
+            decompressor.decompress(self._data[offset:offset + segment_length]) + decompressor.flush(),
+        )
+
+    def to_json_string(self) -> str:
+        return json.dumps(
+            [self.get(name) for name in self._segments],
+            ensure_ascii=False,
+            indent=4,
+        )
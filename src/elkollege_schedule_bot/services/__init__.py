@@ -1,3 +1,6 @@
 __all__ = [
+    "broadcast",
     "logger",
+    "metrics",
+    "parser",
 ]
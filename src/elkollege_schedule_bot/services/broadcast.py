@@ -0,0 +1,260 @@
+import asyncio
+import time
+import uuid
+
+import aiogram
+import aiogram.exceptions
+
+from . import logger
+from .. import constants
+from .. import models
+from ..managers import database
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                current_time = time.monotonic()
+
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (current_time - self._updated) * self._rate,
+                )
+                self._updated = current_time
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class BroadcastService:
+    def __init__(
+            self,
+            database_manager: database.DatabaseManager,
+            logger_service: logger.LoggerService,
+            aiogram_bot: aiogram.Bot,
+    ) -> None:
+        self._database = database_manager
+        self._logger = logger_service
+        self._bot = aiogram_bot
+
+        self._queue: asyncio.Queue[tuple[models.DatabaseBroadcastMessage, int]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._states: dict[int, models.BroadcastState] = {}
+        self._flush_requested = asyncio.Event()
+
+        self._global_bucket = TokenBucket(
+            rate=constants.BROADCAST_GLOBAL_RATE,
+            capacity=constants.BROADCAST_GLOBAL_RATE,
+        )
+        self._chats_sent: dict[int, float] = {}
+        self._paused_until = 0.0
+
+        self._sent = 0
+        self._failed = 0
+        self._blocked = 0
+        self._remaining = 0
+
+    @property
+    def progress(self) -> models.BroadcastProgress:
+        return models.BroadcastProgress(
+            sent=self._sent,
+            failed=self._failed,
+            blocked=self._blocked,
+            remaining=self._remaining,
+        )
+
+    # region Helpers
+
+    def _start_workers(self) -> None:
+        if self._workers:
+            return
+
+        self._workers = [
+            asyncio.create_task(
+                self._worker(),
+                name=f"{self.__class__.__name__}-{worker_index}",
+            ) for worker_index in range(constants.BROADCAST_WORKERS)
+        ]
+        self._workers.append(
+            asyncio.create_task(
+                self._flusher(),
+                name=f"{self.__class__.__name__}-flusher",
+            ),
+        )
+
+    def _enqueue(self, messages_list: list[models.DatabaseBroadcastMessage]) -> None:
+        self._start_workers()
+
+        self._remaining += len(messages_list)
+
+        for message in messages_list:
+            self._queue.put_nowait((message, 0))
+
+    def _set_state(self, message: models.DatabaseBroadcastMessage, state: models.BroadcastState) -> None:
+        self._states[message.id] = state
+        self._remaining -= 1
+
+        if len(self._states) >= constants.BROADCAST_FLUSH_SIZE:
+            self._flush_requested.set()
+
+    async def _flush_states(self) -> None:
+        if not self._states:
+            return
+
+        states = self._states.copy()
+
+        await self._database.broadcasts.edit_states(
+            states=states,
+        )
+
+        for _id in states:
+            del self._states[_id]
+
+        if not self._remaining:
+            await self._compact()
+
+    async def _compact(self) -> None:
+        while True:
+            deleted_messages_count = await self._database.broadcasts.delete_completed_messages(
+                limit=constants.BROADCAST_COMPACTION_BATCH_SIZE,
+            )
+
+            if not deleted_messages_count:
+                break
+
+    async def _wait_for_chat(self, chat_id: int) -> None:
+        current_time = time.monotonic()
+        chat_interval = 1 / constants.BROADCAST_CHAT_RATE
+
+        if len(self._chats_sent) > constants.BROADCAST_CHATS_LIMIT:
+            self._chats_sent = {
+                chat: sent_time for chat, sent_time in self._chats_sent.items()
+                if current_time - sent_time < chat_interval
+            }
+
+        chat_delay = self._chats_sent.get(chat_id, -chat_interval) + chat_interval - current_time
+        self._chats_sent[chat_id] = current_time + max(chat_delay, 0)
+
+        if chat_delay > 0:
+            await asyncio.sleep(chat_delay)
+
+    async def _wait_for_pause(self) -> None:
+        while (pause_delay := self._paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(pause_delay)
+
+    async def _send(self, message: models.DatabaseBroadcastMessage, attempt: int) -> None:
+        await self._wait_for_pause()
+        await self._global_bucket.acquire()
+        await self._wait_for_chat(message.chat_id)
+
+        try:
+            await self._bot.send_message(
+                chat_id=message.chat_id,
+                text=message.text,
+                reply_markup=message.reply_markup,
+            )
+        except aiogram.exceptions.TelegramRetryAfter as exception:
+            self._paused_until = max(
+                self._paused_until,
+                time.monotonic() + exception.retry_after,
+            )
+
+            if attempt < constants.BROADCAST_MAX_ATTEMPTS:
+                self._queue.put_nowait((message, attempt + 1))
+            else:
+                self._failed += 1
+
+                self._set_state(message, models.BroadcastState.FAILED)
+        except aiogram.exceptions.TelegramForbiddenError:
+            self._blocked += 1
+
+            self._set_state(message, models.BroadcastState.BLOCKED)
+        except Exception as exception:
+            self._failed += 1
+
+            self._set_state(message, models.BroadcastState.FAILED)
+
+            self._logger.log_exception(exception)
+        else:
+            self._sent += 1
+
+            self._set_state(message, models.BroadcastState.SENT)
+
+    async def _worker(self) -> None:
+        while True:
+            message, attempt = await self._queue.get()
+
+            try:
+                await self._send(message, attempt)
+            finally:
+                self._queue.task_done()
+
+    async def _flusher(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(),
+                    timeout=constants.BROADCAST_FLUSH_INTERVAL,
+                )
+            except TimeoutError:
+                pass
+
+            self._flush_requested.clear()
+
+            try:
+                await self._flush_states()
+            except Exception as exception:
+                self._logger.log_exception(exception)
+
+    # endregion
+
+    async def broadcast(self, messages_list: list[models.BroadcastMessage]) -> None:
+        job_id = uuid.uuid4().hex
+
+        self._logger.log_event(
+            self.broadcast.__name__,
+            job_id=job_id,
+            messages_count=len(messages_list),
+        )
+
+        self._enqueue(
+            await self._database.broadcasts.add_messages(
+                job_id=job_id,
+                messages_list=messages_list,
+            ),
+        )
+
+    async def resume(self) -> None:
+        pending_messages_list = await self._database.broadcasts.get_pending_messages_list()
+
+        self._logger.log_event(
+            self.resume.__name__,
+            messages_count=len(pending_messages_list),
+        )
+
+        if pending_messages_list:
+            self._enqueue(pending_messages_list)
+        else:
+            await self._compact()
+
+    async def close(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+        self._workers = []
+
+        await self._flush_states()
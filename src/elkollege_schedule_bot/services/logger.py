@@ -1,15 +1,250 @@
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import tempfile
+import time
+import typing
+
 import aiogram
 import pyquoks.services.logger
 
+from .. import constants
+
+
+class _Fields(dict):
+    def __str__(self) -> str:
+        return ", ".join(f"{key}={value!r}" for key, value in self.items())
+
+
+class _SamplingFilter(logging.Filter):
+    def __init__(self, rate: int) -> None:
+        super().__init__()
+
+        self._rate = rate
+        self._window_started = time.monotonic()
+        self._window_count = 0
+
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False):
+            return True
+
+        current_time = time.monotonic()
+
+        if current_time - self._window_started >= 1:
+            self._window_started = current_time
+            self._window_count = 0
+
+        self._window_count += 1
+
+        if self._window_count > self._rate:
+            self.suppressed += 1
+
+            return False
+
+        return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, queue_size: int) -> None:
+        super().__init__(
+            queue.Queue(
+                maxsize=queue_size,
+            ),
+        )
+
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _gzip_namer(name: str) -> str:
+    return f"{name}.gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    with open(source, "rb") as source_file, gzip.open(dest, "wb") as dest_file:
+        shutil.copyfileobj(source_file, dest_file, constants.LOGGING_CHUNK_SIZE)
+
+    os.remove(source)
+
 
 class LoggerService(pyquoks.services.logger.LoggerService):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._handlers = list(self.handlers)
+
+        for handler in self._handlers:
+            self.removeHandler(handler)
+
+        self._handlers = [
+            self._get_rotating_handler(handler) if type(handler) is logging.FileHandler else handler
+            for handler in self._handlers
+        ]
+
+        self._sampling_filter = _SamplingFilter(
+            rate=constants.LOGGING_SAMPLED_RATE,
+        )
+        self._queue_handler = _QueueHandler(
+            queue_size=constants.LOGGING_QUEUE_SIZE,
+        )
+        self._queue_handler.addFilter(self._sampling_filter)
+
+        self._listener = logging.handlers.QueueListener(
+            self._queue_handler.queue,
+            *self._handlers,
+            respect_handler_level=True,
+        )
+        self._listener.start()
+
+        self.addHandler(self._queue_handler)
+
+    # region Helpers
+
+    @staticmethod
+    def _get_rotating_handler(file_handler: logging.FileHandler) -> logging.handlers.RotatingFileHandler:
+        file_handler.close()
+
+        rotating_handler = logging.handlers.RotatingFileHandler(
+            filename=file_handler.baseFilename,
+            maxBytes=constants.LOGGING_MAX_SIZE,
+            backupCount=constants.LOGGING_BACKUP_COUNT,
+            encoding=file_handler.encoding,
+        )
+        rotating_handler.setLevel(file_handler.level)
+        rotating_handler.setFormatter(file_handler.formatter)
+        rotating_handler.namer = _gzip_namer
+        rotating_handler.rotator = _gzip_rotator
+
+        return rotating_handler
+
+    def _copy_recent_lines(self, source_file: typing.BinaryIO, export_file: typing.BinaryIO, since: float) -> bool:
+        formatter = self._rotating_handler.formatter or logging.Formatter()
+        date_format = formatter.datefmt or formatter.default_time_format
+        since_time = formatter.converter(since)
+        prefix_length = len(time.strftime(date_format, since_time))
+
+        while line := source_file.readline():
+            try:
+                line_time = time.strptime(line[:prefix_length].decode(), date_format)
+            except (UnicodeDecodeError, ValueError):
+                continue
+
+            if line_time[:6] >= since_time[:6]:
+                export_file.write(line)
+                shutil.copyfileobj(source_file, export_file, constants.LOGGING_CHUNK_SIZE)
+
+                return True
+
+        return False
+
+    def _has_time_prefix(self) -> bool:
+        formatter = self._rotating_handler.formatter or logging.Formatter()
+        record = logging.makeLogRecord({})
+
+        return formatter.usesTime() and formatter.format(record).startswith(
+            formatter.formatTime(record, formatter.datefmt),
+        )
+
+    @property
+    def _rotating_handler(self) -> logging.handlers.RotatingFileHandler | None:
+        return next(
+            (
+                handler for handler in self._handlers
+                if isinstance(handler, logging.handlers.RotatingFileHandler)
+            ),
+            None,
+        )
+
+    # endregion
+
+    @property
+    def dropped_records(self) -> int:
+        return self._queue_handler.dropped
+
+    @property
+    def suppressed_records(self) -> int:
+        return self._sampling_filter.suppressed
+
+    def log_event(self, event: str, level: int = logging.INFO, sampled: bool = False, **fields) -> None:
+        if self.isEnabledFor(level):
+            self.log(
+                level,
+                "%s (%s)",
+                event,
+                _Fields(fields),
+                extra={
+                    "sampled": sampled,
+                },
+            )
+
     def log_user_interaction(self, user: aiogram.types.User, interaction: str) -> None:
-        user_info = " ".join([
-            " | ".join(i for i in [
-                user.full_name,
-                f"@{user.username}" if user.username else None,
-            ] if i),
-            f"({user.id})",
-        ])
-
-        self.info(f"{user_info} - \"{interaction}\"")
+        self.log_event(
+            "user_interaction",
+            user_id=user.id,
+            full_name=user.full_name,
+            username=user.username,
+            interaction=interaction,
+        )
+
+    @property
+    def export_filename(self) -> str:
+        return f"{os.path.basename(self._rotating_handler.baseFilename)}.gz"
+
+    def export_file(self, since: float) -> str:
+        rotating_handler = self._rotating_handler
+        is_recent = not since or not self._has_time_prefix()
+
+        with tempfile.NamedTemporaryFile(suffix=".gz", delete=False) as export_file:
+            for index in range(rotating_handler.backupCount, 0, -1):
+                segment_path = rotating_handler.rotation_filename(f"{rotating_handler.baseFilename}.{index}")
+
+                try:
+                    if os.path.getmtime(segment_path) < since:
+                        continue
+
+                    with open(segment_path, "rb") as segment_file:
+                        if is_recent:
+                            shutil.copyfileobj(segment_file, export_file, constants.LOGGING_CHUNK_SIZE)
+                        else:
+                            with gzip.GzipFile(fileobj=segment_file) as source_file, gzip.GzipFile(
+                                    fileobj=export_file,
+                                    mode="wb",
+                            ) as gzip_file:
+                                is_recent = self._copy_recent_lines(source_file, gzip_file, since)
+                except FileNotFoundError:
+                    continue
+
+            with open(rotating_handler.baseFilename, "rb") as current_file, gzip.GzipFile(
+                    fileobj=export_file,
+                    mode="wb",
+            ) as gzip_file:
+                if is_recent:
+                    shutil.copyfileobj(current_file, gzip_file, constants.LOGGING_CHUNK_SIZE)
+                else:
+                    self._copy_recent_lines(current_file, gzip_file, since)
+
+        return export_file.name
+
+    def close(self) -> None:
+        if self._queue_handler not in self.handlers:
+            return
+
+        self.removeHandler(self._queue_handler)
+
+        self._listener.stop()
+
+        for handler in self._handlers:
+            self.addHandler(handler)
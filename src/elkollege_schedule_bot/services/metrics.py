@@ -0,0 +1,225 @@
+import time
+import typing
+
+import aiogram
+import aiogram.client.session.middlewares.base
+import aiogram.exceptions
+import aiogram.methods
+import aiohttp.web
+
+from . import broadcast
+from . import logger
+from .. import constants
+from .. import utils
+from ..managers import config
+from ..managers import database
+
+
+class MetricsService:
+    def __init__(
+            self,
+            config_manager: config.ConfigManager,
+            database_manager: database.DatabaseManager,
+            logger_service: logger.LoggerService,
+            broadcast_service: broadcast.BroadcastService,
+            aiogram_bot: aiogram.Bot,
+    ) -> None:
+        self._config = config_manager
+        self._database = database_manager
+        self._logger = logger_service
+        self._broadcast = broadcast_service
+        self._bot = aiogram_bot
+
+        self._callback_durations = utils.Histogram(
+            buckets=constants.METRICS_BUCKETS,
+        )
+        self._api_errors = utils.Counter()
+
+        self._application_runner: aiohttp.web.AppRunner | None = None
+
+        self._bot.session.middleware(self._api_middleware)
+
+    # region Helpers
+
+    @staticmethod
+    def _get_labels_string(label_names: tuple[str, ...], labels: tuple[str, ...]) -> str:
+        return ",".join(
+            "{0}=\"{1}\"".format(
+                label_name,
+                str(label).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n"),
+            ) for label_name, label in zip(label_names, labels)
+        )
+
+    def _render_counter(
+            self,
+            name: str,
+            description: str,
+            label_names: tuple[str, ...],
+            counter: utils.Counter,
+    ) -> list[str]:
+        return [
+            f"# HELP {constants.METRICS_NAMESPACE}_{name} {description}",
+            f"# TYPE {constants.METRICS_NAMESPACE}_{name} counter",
+            *(
+                f"{constants.METRICS_NAMESPACE}_{name}{{{self._get_labels_string(label_names, labels)}}} {value}"
+                for labels, value in counter.values_dict.items()
+            ),
+        ]
+
+    def _render_total(self, name: str, description: str, value: float) -> list[str]:
+        return [
+            f"# HELP {constants.METRICS_NAMESPACE}_{name} {description}",
+            f"# TYPE {constants.METRICS_NAMESPACE}_{name} counter",
+            f"{constants.METRICS_NAMESPACE}_{name} {value}",
+        ]
+
+    def _render_gauge(self, name: str, description: str, value: float) -> list[str]:
+        return [
+            f"# HELP {constants.METRICS_NAMESPACE}_{name} {description}",
+            f"# TYPE {constants.METRICS_NAMESPACE}_{name} gauge",
+            f"{constants.METRICS_NAMESPACE}_{name} {value}",
+        ]
+
+    def _render_histogram(
+            self,
+            name: str,
+            description: str,
+            label_names: tuple[str, ...],
+            histogram: utils.Histogram,
+    ) -> list[str]:
+        lines = [
+            f"# HELP {constants.METRICS_NAMESPACE}_{name} {description}",
+            f"# TYPE {constants.METRICS_NAMESPACE}_{name} histogram",
+        ]
+
+        for labels, (cumulative_counts, total) in histogram.samples_dict.items():
+            labels_string = self._get_labels_string(label_names, labels)
+
+            lines.extend(
+                f"{constants.METRICS_NAMESPACE}_{name}_bucket{{{labels_string},le=\"{bucket}\"}} {count}"
+                for bucket, count in zip([*histogram.buckets, "+Inf"], cumulative_counts)
+            )
+            lines.append(f"{constants.METRICS_NAMESPACE}_{name}_sum{{{labels_string}}} {total}")
+            lines.append(f"{constants.METRICS_NAMESPACE}_{name}_count{{{labels_string}}} {cumulative_counts[-1]}")
+
+        return lines
+
+    def _render(self) -> str:
+        broadcast_progress = self._broadcast.progress
+
+        return "\n".join([
+            *self._render_histogram(
+                name="callback_duration_seconds",
+                description="Callback handler latency by route",
+                label_names=("route",),
+                histogram=self._callback_durations,
+            ),
+            *self._render_counter(
+                name="telegram_api_errors_total",
+                description="Telegram Bot API errors by method and type",
+                label_names=("method", "error"),
+                counter=self._api_errors,
+            ),
+            *self._render_histogram(
+                name="database_query_duration_seconds",
+                description="Database method latency by table and method",
+                label_names=("table", "method"),
+                histogram=self._database.query_durations,
+            ),
+            *self._render_total(
+                name="log_dropped_records_total",
+                description="Log records dropped because the log queue was full",
+                value=self._logger.dropped_records,
+            ),
+            *self._render_total(
+                name="log_suppressed_records_total",
+                description="Sampled log records suppressed by rate limiting",
+                value=self._logger.suppressed_records,
+            ),
+            *self._render_total(
+                name="broadcast_sent_messages_total",
+                description="Broadcast messages sent since startup",
+                value=broadcast_progress.sent,
+            ),
+            *self._render_total(
+                name="broadcast_failed_messages_total",
+                description="Broadcast messages failed since startup",
+                value=broadcast_progress.failed,
+            ),
+            *self._render_total(
+                name="broadcast_blocked_messages_total",
+                description="Broadcast messages to chats that blocked the bot since startup",
+                value=broadcast_progress.blocked,
+            ),
+            *self._render_gauge(
+                name="broadcast_remaining_messages",
+                description="Broadcast messages waiting to be sent",
+                value=broadcast_progress.remaining,
+            ),
+        ]) + "\n"
+
+    async def _metrics_handler(self, request: aiohttp.web.Request) -> aiohttp.web.Response:
+        return aiohttp.web.Response(
+            text=self._render(),
+            content_type=constants.METRICS_CONTENT_TYPE,
+            charset="utf-8",
+        )
+
+    async def _api_middleware(
+            self,
+            make_request: aiogram.client.session.middlewares.base.NextRequestMiddlewareType,
+            bot: aiogram.Bot,
+            method: aiogram.methods.TelegramMethod,
+    ) -> typing.Any:
+        try:
+            return await make_request(bot, method)
+        except aiogram.exceptions.TelegramAPIError as exception:
+            self._api_errors.inc(
+                labels=(
+                    method.__api_method__,
+                    type(exception).__name__,
+                ),
+            )
+
+            raise
+
+    # endregion
+
+    def observe_callback(self, route: str, started: float) -> None:
+        self._callback_durations.observe(
+            labels=(
+                route,
+            ),
+            value=time.perf_counter() - started,
+        )
+
+    async def start(self) -> None:
+        if not self._config.settings.metrics:
+            return
+
+        application = aiohttp.web.Application()
+        application.router.add_get(
+            path=constants.METRICS_PATH,
+            handler=self._metrics_handler,
+        )
+
+        self._application_runner = aiohttp.web.AppRunner(application)
+
+        await self._application_runner.setup()
+        await aiohttp.web.TCPSite(
+            runner=self._application_runner,
+            host=self._config.settings.metrics_host,
+            port=self._config.settings.metrics_port,
+        ).start()
+
+        self._logger.log_event(
+            self.start.__name__,
+            host=self._config.settings.metrics_host,
+            port=self._config.settings.metrics_port,
+        )
+
+    async def close(self) -> None:
+        if self._application_runner:
+            await self._application_runner.cleanup()
+
+            self._application_runner = None
@@ -0,0 +1,132 @@
+import asyncio
+import concurrent.futures
+import concurrent.futures.process
+import io
+import json
+import resource
+import typing
+
+import openpyxl
+import schedule_parser.utils
+
+from . import logger
+from .. import constants
+from .. import models
+from ..managers import config
+
+
+def _limit_memory(memory_limit: int) -> None:
+    resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+
+
+def _parse_first_worksheet[T](
+        data: bytes,
+        read_only: bool,
+        parse_function: typing.Callable[..., T],
+) -> T:
+    workbook = openpyxl.load_workbook(
+        filename=io.BytesIO(data),
+        read_only=read_only,
+    )
+
+    try:
+        return parse_function(
+            worksheet=workbook.worksheets[0],
+        )
+    finally:
+        workbook.close()
+
+
+def _parse_schedule(data: bytes, read_only: bool) -> bytes:
+    return models.DatabaseSchedule.pack_groups_list(
+        _parse_first_worksheet(
+            data=data,
+            read_only=read_only,
+            parse_function=schedule_parser.utils.parse_schedule,
+        ),
+    )
+
+
+def _parse_substitutions(data: bytes, read_only: bool) -> str:
+    parsed_substitutions = _parse_first_worksheet(
+        data=data,
+        read_only=read_only,
+        parse_function=schedule_parser.utils.parse_substitutions,
+    )
+
+    return json.dumps(
+        [substitution.model_dump() for substitution in parsed_substitutions]
+    )
+
+
+class ParserService:
+    def __init__(
+            self,
+            config_manager: config.ConfigManager,
+            logger_service: logger.LoggerService,
+    ) -> None:
+        self._config = config_manager
+        self._logger = logger_service
+
+        self._executor = self._create_executor()
+
+    # region Helpers
+
+    def _create_executor(self) -> concurrent.futures.ProcessPoolExecutor:
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_limit_memory,
+            initargs=(
+                self._config.settings.parsing_memory_limit * 1024 ** 2,
+            ),
+        )
+
+    async def _run[T](self, function: typing.Callable[[bytes, bool], T], data: bytes) -> T:
+        if self._config.settings.workbook_read_only:
+            try:
+                return await self._run_in_executor(function, data, True)
+            except constants.READ_ONLY_FALLBACK_EXCEPTIONS as exception:
+                self._logger.log_event(
+                    function.__name__,
+                    read_only=True,
+                    fallback=type(exception).__name__,
+                )
+
+        return await self._run_in_executor(function, data, False)
+
+    async def _run_in_executor[T](self, function: typing.Callable[[bytes, bool], T], data: bytes, read_only: bool) -> T:
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    function,
+                    data,
+                    read_only,
+                ),
+                timeout=self._config.settings.parsing_timeout,
+            )
+        except (TimeoutError, concurrent.futures.process.BrokenProcessPool) as exception:
+            self._logger.log_event(
+                function.__name__,
+                read_only=read_only,
+                exception=type(exception).__name__,
+            )
+
+            self._executor.kill_workers()
+            self._executor = self._create_executor()
+
+            raise
+
+    # endregion
+
+    async def parse_schedule(self, data: bytes) -> bytes:
+        return await self._run(_parse_schedule, data)
+
+    async def parse_substitutions(self, data: bytes) -> str:
+        return await self._run(_parse_substitutions, data)
+
+    def close(self) -> None:
+        self._executor.shutdown(
+            wait=False,
+            cancel_futures=True,
+        )
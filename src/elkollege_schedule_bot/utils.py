@@ -1,8 +1,106 @@
+import bisect
+import collections
 import datetime
+import hashlib
+import itertools
 
 import aiogram
+import schedule_parser.utils
 
 from . import constants
+from . import models
+
+
+class LRUCache[K, V]:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._items: collections.OrderedDict[K, V] = collections.OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def cache_info(self) -> models.CacheInfo:
+        return models.CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._items),
+            max_size=self._max_size,
+            evictions=self._evictions,
+        )
+
+    def get(self, key: K) -> V | None:
+        try:
+            self._items.move_to_end(key)
+        except KeyError:
+            self._misses += 1
+
+            return None
+
+        self._hits += 1
+
+        return self._items[key]
+
+    def set(self, key: K, value: V) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+
+        if len(self._items) > self._max_size:
+            self._items.popitem(last=False)
+            self._evictions += 1
+
+    def pop(self, key: K) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+class Counter:
+    def __init__(self) -> None:
+        self._values: dict[tuple[str, ...], float] = {}
+
+    @property
+    def values_dict(self) -> dict[tuple[str, ...], float]:
+        return dict(self._values)
+
+    def inc(self, labels: tuple[str, ...], amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self._buckets = buckets
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    @property
+    def buckets(self) -> tuple[float, ...]:
+        return self._buckets
+
+    @property
+    def samples_dict(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        return {
+            labels: (
+                list(itertools.accumulate(counts)),
+                self._sums[labels],
+            ) for labels, counts in list(self._counts.items())
+        }
+
+    def observe(self, labels: tuple[str, ...], value: float) -> None:
+        if labels not in self._counts:
+            self._sums[labels] = 0.0
+            self._counts[labels] = [0] * (len(self._buckets) + 1)
+
+        self._counts[labels][bisect.bisect_left(self._buckets, value)] += 1
+        self._sums[labels] += value
 
 
 def get_message_thread_id(message: aiogram.types.Message) -> int | None:
@@ -24,3 +122,42 @@ def get_timestamp_from_date(date: datetime.datetime) -> int:
 
 def get_date_from_timestamp(timestamp: int) -> datetime.datetime:
     return datetime.datetime.fromtimestamp(timestamp)
+
+
+def get_buildings_dict(buildings_list: list[str]) -> dict[int, str]:
+    return dict(enumerate(buildings_list, start=constants.DEFAULT_BUILDING_ID))
+
+
+def get_teacher_id(teacher_name: str) -> str:
+    return hashlib.blake2s(
+        teacher_name.encode(),
+        digest_size=constants.TEACHER_ID_DIGEST_SIZE,
+    ).hexdigest()
+
+
+def get_teacher_periods_list(
+        teacher_name: str,
+        teacher_periods: tuple[models.TeacherPeriod, ...],
+        substitutions_index: models.SubstitutionsIndex,
+) -> list[models.TeacherPeriod]:
+    groups_dict = collections.defaultdict(list)
+
+    for teacher_period in teacher_periods:
+        groups_dict[teacher_period.group_name].append(teacher_period.period)
+
+    for group_name in substitutions_index.teachers_dict.get(teacher_name, ()):
+        groups_dict[group_name]
+
+    return sorted(
+        (
+            models.TeacherPeriod(
+                group_name=group_name,
+                period=period,
+            ) for group_name, periods_list in groups_dict.items()
+            for period in schedule_parser.utils.apply_substitutions_to_schedule(
+                schedule=periods_list,
+                substitutions=substitutions_index.groups_dict.get(group_name, []),
+            ) if period.teacher == teacher_name
+        ),
+        key=lambda teacher_period: teacher_period.period.number,
+    )